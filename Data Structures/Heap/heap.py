@@ -0,0 +1,468 @@
+import operator
+
+
+class Heap:
+    """
+    A class representing a binary heap, ordered by a key function.
+
+    The element at the top is the one with the smallest key, or with reverse
+    set the largest; without a key the elements themselves are compared.
+    MinHeap and MaxHeap are this heap with the default key and reverse off or
+    on. With a key, each element's key is computed once, when it enters the
+    heap, and kept in the keys list alongside heapArr; the sifts compare and
+    move the stored keys rather than calling the key again.
+
+    The sifts are loops rather than recursion, and they move a hole instead of
+    swapping: the element being sifted is held aside, the elements it passes
+    are shifted one level into the hole, and it is written once at the end.
+
+    The backing list doubles when an insert finds it full, so size is only a
+    starting capacity. Call reserve to grow it ahead of a known number of
+    inserts, and shrinkToFit to give back the unused slots.
+    """
+
+    def __init__(self, size=8, key=None, reverse=False) -> None:
+        """
+        Initialize a Heap instance with a given size.
+
+        Parameters:
+            size (int): The initial size of the heap.
+            key (callable): Maps an element to the value it is ordered by; None
+                orders the elements themselves.
+            reverse (bool): Put the largest key at the top instead of the
+                smallest.
+        """
+        self.size = size
+        self.heapArr = [None] * size
+        self.count = 0
+        self.original_size = size
+        self.key = key
+        self.reverse = reverse
+        # keys[i] is the key of heapArr[i], or keys is None without a key.
+        self.keys = None if key is None else [None] * size
+        # before(a, b) is True when an element keyed a belongs above one keyed b.
+        self.before = operator.gt if reverse else operator.lt
+
+    @classmethod
+    def fromIterable(cls, data, size=None, **kwargs):
+        """
+        Build a heap from the elements of data in O(n) time, using Floyd's
+        method: the elements are placed as they are, then every parent is
+        sifted down, from the last one up to the root. This beats inserting
+        them one at a time, which costs O(n log n).
+
+        Parameters:
+            data (iterable): The elements of the heap.
+            size (int): The size of the heap; at least the number of elements,
+                which is the default.
+            **kwargs: Passed on to the constructor, e.g. key and reverse.
+
+        Returns:
+            Heap: A heap holding the elements of data.
+        """
+        items = list(data)
+        heap = cls(max(len(items), size or 0), **kwargs)
+        heap.heapArr[: len(items)] = items
+        if heap.keys is not None:
+            heap.keys[: len(items)] = map(heap.key, items)
+        heap.count = len(items)
+        for index in range(heap.count // 2 - 1, -1, -1):
+            heap.heapifyDown(index)
+        return heap
+
+    def __len__(self):
+        return self.count
+
+    def getParentIndex(self, index):
+        """
+        Get the index of the parent node of the node at the given index.
+
+        Parameters:
+            index (int): The index of the node.
+
+        Returns:
+            int: The index of the parent node.
+        """
+        return (index - 1) // 2
+
+    def getLeftChildIndex(self, index):
+        """
+        Get the index of the left child node of the node at the given index.
+
+        Parameters:
+            index (int): The index of the node.
+
+        Returns:
+            int: The index of the left child node.
+        """
+        return 2 * index + 1
+
+    def getRightChildIndex(self, index):
+        """
+        Get the index of the right child node of the node at the given index.
+
+        Parameters:
+            index (int): The index of the node.
+
+        Returns:
+            int: The index of the right child node.
+        """
+        return 2 * index + 2
+
+    def hasParent(self, index):
+        """
+        Check if the node at the given index has a parent node.
+
+        Parameters:
+            index (int): The index of the node.
+
+        Returns:
+            bool: True if the node has a parent, False otherwise.
+        """
+        return self.getParentIndex(index) >= 0
+
+    def hasLeftChild(self, index):
+        """
+        Check if the node at the given index has a left child node.
+
+        Parameters:
+            index (int): The index of the node.
+
+        Returns:
+            bool: True if the node has a left child, False otherwise.
+        """
+        return self.getLeftChildIndex(index) < self.count
+
+    def hasRightChild(self, index):
+        """
+        Check if the node at the given index has a right child node.
+
+        Parameters:
+            index (int): The index of the node.
+
+        Returns:
+            bool: True if the node has a right child, False otherwise.
+        """
+        return self.getRightChildIndex(index) < self.count
+
+    def parent(self, index):
+        """
+        Get the value of the parent node of the node at the given index.
+
+        Parameters:
+            index (int): The index of the node.
+
+        Returns:
+            int: The value of the parent node.
+        """
+        return self.heapArr[self.getParentIndex(index)]
+
+    def leftChild(self, index):
+        """
+        Get the value of the left child node of the node at the given index.
+
+        Parameters:
+            index (int): The index of the node.
+
+        Returns:
+            int: The value of the left child node.
+        """
+        return self.heapArr[self.getLeftChildIndex(index)]
+
+    def rightChild(self, index):
+        """
+        Get the value of the right child node of the node at the given index.
+
+        Parameters:
+            index (int): The index of the node.
+
+        Returns:
+            int: The value of the right child node.
+        """
+        return self.heapArr[self.getRightChildIndex(index)]
+
+    def isFull(self):
+        """
+        Check if the heap is full, i.e. the next insert will have to grow it.
+
+        Returns:
+            bool: True if the heap is full, False otherwise.
+        """
+        return self.count == self.size
+
+    def swap(self, index1, index2):
+        """
+        Swap the values of nodes at the given indices.
+
+        Parameters:
+            index1 (int): The index of the first node.
+            index2 (int): The index of the second node.
+        """
+        temp = self.heapArr[index1]
+        self.heapArr[index1] = self.heapArr[index2]
+        self.heapArr[index2] = temp
+        if self.keys is not None:
+            keys = self.keys
+            keys[index1], keys[index2] = keys[index2], keys[index1]
+
+    def heapifyUp(self, index):
+        """
+        Restore the heap property by moving the node at the given index upwards.
+
+        Parameters:
+            index (int): The index of the node.
+
+        Returns:
+            int: The index the node ended up at.
+        """
+        if self.keys is not None:
+            return self._keyedHeapifyUp(index)
+        heapArr = self.heapArr
+        before = self.before
+        data = heapArr[index]
+        while index > 0:
+            parentIndex = (index - 1) >> 1
+            parent = heapArr[parentIndex]
+            if not before(data, parent):
+                break
+            heapArr[index] = parent
+            index = parentIndex
+        heapArr[index] = data
+        return index
+
+    def heapifyDown(self, index):
+        """
+        Restore the heap property by moving the node at the given index downwards.
+
+        Parameters:
+            index (int): The index of the node.
+
+        Returns:
+            int: The index the node ended up at.
+        """
+        if self.keys is not None:
+            return self._keyedHeapifyDown(index)
+        heapArr = self.heapArr
+        before = self.before
+        count = self.count
+        data = heapArr[index]
+        child = 2 * index + 1
+        while child < count:
+            right = child + 1
+            if right < count and before(heapArr[right], heapArr[child]):
+                child = right
+            if not before(heapArr[child], data):
+                break
+            heapArr[index] = heapArr[child]
+            index = child
+            child = 2 * index + 1
+        heapArr[index] = data
+        return index
+
+    def _keyedHeapifyUp(self, index):
+        """
+        heapifyUp for a heap with a key: compares the stored keys and moves
+        each key along with its element.
+        """
+        heapArr = self.heapArr
+        keys = self.keys
+        before = self.before
+        data = heapArr[index]
+        dataKey = keys[index]
+        while index > 0:
+            parentIndex = (index - 1) >> 1
+            parentKey = keys[parentIndex]
+            if not before(dataKey, parentKey):
+                break
+            heapArr[index] = heapArr[parentIndex]
+            keys[index] = parentKey
+            index = parentIndex
+        heapArr[index] = data
+        keys[index] = dataKey
+        return index
+
+    def _keyedHeapifyDown(self, index):
+        """
+        heapifyDown for a heap with a key: compares the stored keys and moves
+        each key along with its element.
+        """
+        heapArr = self.heapArr
+        keys = self.keys
+        before = self.before
+        count = self.count
+        data = heapArr[index]
+        dataKey = keys[index]
+        child = 2 * index + 1
+        while child < count:
+            right = child + 1
+            if right < count and before(keys[right], keys[child]):
+                child = right
+            childKey = keys[child]
+            if not before(childKey, dataKey):
+                break
+            heapArr[index] = heapArr[child]
+            keys[index] = childKey
+            index = child
+            child = 2 * index + 1
+        heapArr[index] = data
+        keys[index] = dataKey
+        return index
+
+    def _place(self, index, data):
+        """
+        Store data at the given index, along with its key if the heap has one.
+        """
+        self.heapArr[index] = data
+        if self.keys is not None:
+            self.keys[index] = self.key(data)
+
+    def insert(self, data):
+        """
+        Insert a new element into the heap.
+
+        Parameters:
+            data: The element to be inserted.
+        """
+        if self.count == self.size:
+            self.resize(max(1, self.size * 2))
+        self._place(self.count, data)
+        self.count += 1
+        self.heapifyUp(self.count - 1)
+
+    def remove(self):
+        """
+        Remove and return the element at the top of the heap.
+
+        Returns:
+            The element at the top of the heap.
+
+        Raises:
+            IndexError: If the heap is empty.
+        """
+        if self.count == 0:
+            raise IndexError("Heap is empty")
+        data = self.heapArr[0]
+        self.count -= 1
+        last = self.heapArr[self.count]
+        self.heapArr[self.count] = None
+        keys = self.keys
+        if keys is not None:
+            lastKey = keys[self.count]
+            keys[self.count] = None
+        if self.count:
+            self.heapArr[0] = last
+            if keys is not None:
+                keys[0] = lastKey
+            self.heapifyDown(0)
+        return data
+
+    def heapReplace(self, data):
+        """
+        Remove and return the element at the top, then insert data. This takes
+        a single sift down, rather than one for the removal and one for the
+        insertion.
+
+        Parameters:
+            data: The element to be inserted.
+
+        Returns:
+            The element at the top of the heap before data was inserted.
+
+        Raises:
+            IndexError: If the heap is empty.
+        """
+        if self.count == 0:
+            raise IndexError("Heap is empty")
+        root = self.heapArr[0]
+        self._place(0, data)
+        self.heapifyDown(0)
+        return root
+
+    def pushPop(self, data):
+        """
+        Insert data, then remove and return the element at the top. If data
+        would be at the top itself it is returned straight away and the heap is
+        left untouched.
+
+        Parameters:
+            data: The element to be inserted.
+
+        Returns:
+            The top of data and the elements in the heap.
+        """
+        if self.count == 0:
+            return data
+        if self.keys is None:
+            if not self.before(self.heapArr[0], data):
+                return data
+            root = self.heapArr[0]
+            self.heapArr[0] = data
+        else:
+            dataKey = self.key(data)
+            if not self.before(self.keys[0], dataKey):
+                return data
+            root = self.heapArr[0]
+            self.heapArr[0] = data
+            self.keys[0] = dataKey
+        self.heapifyDown(0)
+        return root
+
+    def peek(self):
+        """
+        Return the element at the top of the heap without removing it.
+
+        Returns:
+            The element at the top of the heap, or None if it is empty.
+        """
+        return self.heapArr[0] if self.count else None
+
+    def resize(self, size):
+        """
+        Move the elements to a backing list with the given size.
+
+        Parameters:
+            size (int): The new size of the heap; at least its count.
+        """
+        self.heapArr = self.heapArr[: self.count] + [None] * (size - self.count)
+        if self.keys is not None:
+            self.keys = self.keys[: self.count] + [None] * (size - self.count)
+        self.size = size
+
+    def reserve(self, n):
+        """
+        Grow the heap, if needed, so that it holds n elements without growing
+        again.
+
+        Parameters:
+            n (int): The number of elements to make room for.
+        """
+        if n > self.size:
+            self.resize(n)
+
+    def shrinkToFit(self):
+        """
+        Shrink the heap to exactly its count, releasing the unused slots.
+        """
+        self.resize(self.count)
+
+    def clear(self):
+        """
+        Clear the heap by resetting its size and count.
+        """
+        self.size = self.original_size
+        self.heapArr = [None] * self.size
+        if self.keys is not None:
+            self.keys = [None] * self.size
+        self.count = 0
+
+
+if __name__ == "__main__":
+    # Example Usage
+    words = Heap.fromIterable(["pear", "fig", "banana", "kiwi"], key=len)
+    print("Shortest word:", words.peek())
+    print("Removed:", words.remove(), words.remove())
+
+    longest = Heap(key=len, reverse=True)
+    for word in ["pear", "fig", "banana", "kiwi"]:
+        longest.insert(word)
+    print("Longest word:", longest.peek())
@@ -0,0 +1,107 @@
+# Benchmark: iterative hole-based Heap vs the previous recursive MinHeap
+
+import random
+import time
+
+from min_heap import MinHeap
+
+
+class RecursiveMinHeap:
+    """
+    The previous MinHeap: recursive sifts that swap one level at a time and
+    go through the index and child helper methods at every step.
+    """
+
+    def __init__(self, size) -> None:
+        self.size = size
+        self.heapArr = [None] * size
+        self.count = 0
+
+    def getParentIndex(self, index):
+        return (index - 1) // 2
+
+    def getLeftChildIndex(self, index):
+        return 2 * index + 1
+
+    def getRightChildIndex(self, index):
+        return 2 * index + 2
+
+    def hasParent(self, index):
+        return self.getParentIndex(index) >= 0
+
+    def hasLeftChild(self, index):
+        return self.getLeftChildIndex(index) < self.count
+
+    def hasRightChild(self, index):
+        return self.getRightChildIndex(index) < self.count
+
+    def parent(self, index):
+        return self.heapArr[self.getParentIndex(index)]
+
+    def leftChild(self, index):
+        return self.heapArr[self.getLeftChildIndex(index)]
+
+    def rightChild(self, index):
+        return self.heapArr[self.getRightChildIndex(index)]
+
+    def swap(self, index1, index2):
+        temp = self.heapArr[index1]
+        self.heapArr[index1] = self.heapArr[index2]
+        self.heapArr[index2] = temp
+
+    def heapifyUp(self, index):
+        if self.hasParent(index) and self.heapArr[index] < self.parent(index):
+            self.swap(self.getParentIndex(index), index)
+            self.heapifyUp(self.getParentIndex(index))
+
+    def insert(self, data):
+        self.heapArr[self.count] = data
+        self.count += 1
+        self.heapifyUp(self.count - 1)
+
+    def heapifyDown(self, index):
+        smallest = index
+        if self.hasLeftChild(index) and self.heapArr[smallest] > self.leftChild(index):
+            smallest = self.getLeftChildIndex(index)
+        if self.hasRightChild(index) and self.heapArr[smallest] > self.rightChild(index):
+            smallest = self.getRightChildIndex(index)
+        if smallest != index:
+            self.swap(index, smallest)
+            self.heapifyDown(smallest)
+
+    def removeMin(self):
+        data = self.heapArr[0]
+        self.heapArr[0] = self.heapArr[self.count - 1]
+        self.heapArr[self.count - 1] = None
+        self.count -= 1
+        self.heapifyDown(0)
+        return data
+
+
+def ns_per_op(heap, values):
+    """
+    Time inserting every value and then removing them all, and return the
+    nanoseconds per insert and per removeMin.
+    """
+    start = time.perf_counter()
+    for value in values:
+        heap.insert(value)
+    middle = time.perf_counter()
+    for _ in values:
+        heap.removeMin()
+    end = time.perf_counter()
+    return (middle - start) * 1e9 / len(values), (end - middle) * 1e9 / len(values)
+
+
+def main():
+    print(f"{'n':>9}{'op':>11}{'recursive (ns)':>16}{'iterative (ns)':>16}{'speedup':>9}")
+    for n in (10_000, 100_000, 1_000_000):
+        values = [random.random() for _ in range(n)]
+        old = ns_per_op(RecursiveMinHeap(n), values)
+        new = ns_per_op(MinHeap(n), values)
+        for op, before, after in zip(("insert", "removeMin"), old, new):
+            print(f"{n:>9}{op:>11}{before:>16.0f}{after:>16.0f}{before / after:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
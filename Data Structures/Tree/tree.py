@@ -1,4 +1,14 @@
+from array import array
+
+
 class Tree:
+    """
+    A class representing a node of a general tree. Nodes declare __slots__, so
+    they carry no per-instance __dict__.
+    """
+
+    __slots__ = ("data", "children", "parent")
+
     def __init__(self, data) -> None:
         """
         Initializes a Tree node with the given data.
@@ -45,29 +55,132 @@ class Tree:
             for child in self.children:
                 child.print_tree()
 
+
+class TreePool:
+    """
+    A class representing a whole general tree stored in parallel arrays instead
+    of one Tree object per node.
+
+    Node i is described by data[i] and by typed arrays of indices: parent[i],
+    first_child[i], last_child[i] and next_sibling[i], where -1 means "none".
+    Apart from the payloads the pool allocates no Python object per node.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializes an empty tree pool.
+        """
+        self.data = []
+        self.parent = array("q")
+        self.first_child = array("q")
+        self.last_child = array("q")
+        self.next_sibling = array("q")
+
+    def __len__(self) -> int:
+        """
+        Returns the number of nodes in the pool.
+        """
+        return len(self.data)
+
+    def add_node(self, data, parent=-1) -> int:
+        """
+        Adds a node, as the last child of parent or as a root.
+
+        Args:
+            data: The data to be stored in the node.
+            parent: The index of the parent node, or -1 for a root.
+
+        Returns:
+            int: The index of the new node.
+        """
+        index = len(self.data)
+        self.data.append(data)
+        self.parent.append(parent)
+        self.first_child.append(-1)
+        self.last_child.append(-1)
+        self.next_sibling.append(-1)
+        if parent != -1:
+            if self.first_child[parent] == -1:
+                self.first_child[parent] = index
+            else:
+                self.next_sibling[self.last_child[parent]] = index
+            self.last_child[parent] = index
+        return index
+
+    def children(self, index):
+        """
+        Yields the indices of the children of the given node, in order.
+
+        Args:
+            index: The index of the node.
+        """
+        child = self.first_child[index]
+        while child != -1:
+            yield child
+            child = self.next_sibling[child]
+
+    def get_level(self, index) -> int:
+        """
+        Returns the level of the given node in the tree.
+
+        Args:
+            index: The index of the node.
+
+        Returns:
+            int: The level of the node.
+        """
+        level = 0
+        p = self.parent[index]
+        while p != -1:
+            level += 1
+            p = self.parent[p]
+        return level
+
+    def print_tree(self, index=0):
+        """
+        Prints the tree structure starting from the given node.
+
+        Args:
+            index: The index of the node to start from.
+        """
+        level = ' ' * self.get_level(index) * 2
+        prefix = level + '|__' if self.parent[index] != -1 else ""
+        print(prefix + self.data[index])
+        for child in self.children(index):
+            self.print_tree(child)
+
+
 # Example Usage
+if __name__ == "__main__":
+    tree = Tree("Electronics")
+    laptop = Tree("Laptops")
+    mobiles = Tree("Mobiles")
+    tablets = Tree("Tablets")
 
-tree = Tree("Electronics")
-laptop = Tree("Laptops")
-mobiles = Tree("Mobiles")
-tablets = Tree("Tablets")
+    laptop.add_child(Tree("HP"))
+    laptop.add_child(Tree("ASUS"))
+    laptop.add_child(Tree("Lenovo"))
 
-laptop.add_child(Tree("HP"))
-laptop.add_child(Tree("ASUS"))
-laptop.add_child(Tree("Lenovo"))
+    mobiles.add_child(Tree("Lava"))
+    mobiles.add_child(Tree("Lenovo"))
+    mobiles.add_child(Tree("MicroMax"))
+    mobiles.add_child(Tree("Redmi"))
+    mobiles.add_child(Tree("Asus"))
+    mobiles.add_child(Tree("Realme"))
+    mobiles.add_child(Tree("Iqoo"))
 
-mobiles.add_child(Tree("Lava"))
-mobiles.add_child(Tree("Lenovo"))
-mobiles.add_child(Tree("MicroMax"))
-mobiles.add_child(Tree("Redmi"))
-mobiles.add_child(Tree("Asus"))
-mobiles.add_child(Tree("Realme"))
-mobiles.add_child(Tree("Iqoo"))
+    tablets.add_child(Tree("Apple Ipad"))
 
-tablets.add_child(Tree("Apple Ipad"))
+    tree.add_child(laptop)
+    tree.add_child(mobiles)
+    tree.add_child(tablets)
 
-tree.add_child(laptop)
-tree.add_child(mobiles)
-tree.add_child(tablets)
+    tree.print_tree()
 
-tree.print_tree()
\ No newline at end of file
+    pool = TreePool()
+    root = pool.add_node("Electronics")
+    laptops = pool.add_node("Laptops", root)
+    pool.add_node("HP", laptops)
+    pool.add_node("ASUS", laptops)
+    pool.add_node("Tablets", root)
+    pool.print_tree(root)
\ No newline at end of file
@@ -0,0 +1,404 @@
+# asyncio Queue Data Structures
+
+import asyncio
+import collections
+
+from circular_queue import CircularQueue
+from deque import Deque
+
+
+class AsyncQueue:
+    """
+    A FIFO queue for passing items between asyncio tasks.
+
+    Items are kept in the ring-buffer Deque, so put and get are O(1) however
+    far a consumer falls behind. put waits while the queue is full and get
+    waits while it is empty; both take a timeout and raise TimeoutError when it
+    expires. get_many collects a batch of items, for consumers that would
+    rather handle several at a time.
+
+    Every item put counts as unfinished until a consumer calls task_done for
+    it, and join waits until no items are unfinished.
+
+    Attributes:
+    - items: The storage holding the queued items.
+    - maxsize: The maximum number of items, or 0 for no limit.
+    """
+
+    def __init__(self, maxsize=0):
+        """
+        Initialize an empty queue.
+
+        Parameters:
+        - maxsize (int): The maximum number of items, or 0 for no limit.
+        """
+        self.items = Deque()
+        self.maxsize = maxsize
+        self._getters = collections.deque()
+        self._putters = collections.deque()
+        # get_many callers wait for a number of items rather than one, so
+        # every put wakes them all to check.
+        self._batchers = collections.deque()
+        self._unfinished = 0
+        self._finished = asyncio.Event()
+        self._finished.set()
+
+    def __len__(self):
+        return len(self.items)
+
+    def size(self):
+        """
+        Return the number of items in the queue.
+        """
+        return len(self.items)
+
+    def is_empty(self):
+        """
+        Check if the queue is empty.
+        """
+        return len(self.items) == 0
+
+    def is_full(self):
+        """
+        Check if the queue is full. An unbounded queue is never full.
+        """
+        return 0 < self.maxsize <= len(self.items)
+
+    def _most(self):
+        """
+        Return the most items the queue can ever hold at once, or 0 if it is
+        unbounded.
+        """
+        return self.maxsize
+
+    def _push(self, item):
+        """
+        Store item at the rear and return the number of items evicted to make
+        room for it.
+        """
+        self.items.addRear(item)
+        return 0
+
+    def _pop(self):
+        """
+        Remove and return the item at the front.
+        """
+        return self.items.removeFront()
+
+    def _pop_many(self, n):
+        """
+        Remove and return up to n items from the front, as a list.
+        """
+        return [self.items.removeFront() for _ in range(min(n, len(self.items)))]
+
+    @staticmethod
+    def _wake_next(waiters):
+        while waiters:
+            waiter = waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                break
+
+    async def _wait(self, waiters, ready):
+        """
+        Sleep until woken through waiters. If the caller is cancelled after
+        being woken, the wakeup is passed on to the next waiter as long as
+        ready() still holds, so that it is not lost.
+        """
+        waiter = asyncio.get_running_loop().create_future()
+        waiters.append(waiter)
+        try:
+            await waiter
+        except BaseException:
+            waiter.cancel()
+            try:
+                waiters.remove(waiter)
+            except ValueError:
+                pass
+            if not waiter.cancelled() and ready():
+                self._wake_next(waiters)
+            raise
+
+    def _added(self, evicted):
+        """
+        Account for an item just stored and wake the consumers waiting for it.
+        """
+        self._unfinished += 1 - evicted
+        if self._unfinished:
+            self._finished.clear()
+        self._wake_next(self._getters)
+        for batcher in self._batchers:
+            if not batcher.done():
+                batcher.set_result(None)
+        self._batchers.clear()
+
+    async def _room(self, timeout):
+        """
+        Wait until the queue is not full.
+
+        Raises:
+        - TimeoutError: If the queue is still full after timeout seconds.
+        """
+        async with asyncio.timeout(timeout):
+            while self.is_full():
+                await self._wait(self._putters, lambda: not self.is_full())
+
+    async def _item(self, timeout):
+        """
+        Wait until the queue is not empty.
+
+        Raises:
+        - TimeoutError: If the queue is still empty after timeout seconds.
+        """
+        async with asyncio.timeout(timeout):
+            while self.is_empty():
+                await self._wait(self._getters, lambda: not self.is_empty())
+
+    def put_nowait(self, item):
+        """
+        Add an item to the rear of the queue without waiting.
+
+        Parameters:
+        - item: The item to add.
+
+        Raises:
+        - OverflowError: If the queue is full.
+        """
+        if self.is_full():
+            raise OverflowError("put to a full queue")
+        self._added(self._push(item))
+
+    async def put(self, item, timeout=None):
+        """
+        Add an item to the rear of the queue, waiting for room if it is full.
+
+        Parameters:
+        - item: The item to add.
+        - timeout (float): The longest to wait in seconds, or None to wait
+        forever.
+
+        Raises:
+        - TimeoutError: If the queue is still full after timeout seconds.
+        """
+        await self._room(timeout)
+        self.put_nowait(item)
+
+    def get_nowait(self):
+        """
+        Remove and return the item at the front of the queue without waiting.
+
+        Returns:
+        - item: The item at the front of the queue.
+
+        Raises:
+        - IndexError: If the queue is empty.
+        """
+        if self.is_empty():
+            raise IndexError("get from an empty queue")
+        item = self._pop()
+        self._wake_next(self._putters)
+        return item
+
+    async def get(self, timeout=None):
+        """
+        Remove and return the item at the front of the queue, waiting for one
+        if it is empty.
+
+        Parameters:
+        - timeout (float): The longest to wait in seconds, or None to wait
+        forever.
+
+        Returns:
+        - item: The item at the front of the queue.
+
+        Raises:
+        - TimeoutError: If the queue is still empty after timeout seconds.
+        """
+        await self._item(timeout)
+        return self.get_nowait()
+
+    async def get_many(self, n, timeout=None):
+        """
+        Remove and return a batch of up to n items from the front of the
+        queue. Waits until n items are queued (or as many as the queue can
+        hold) or timeout seconds have passed, whichever comes first, then takes
+        what is there.
+
+        Parameters:
+        - n (int): The largest number of items to return.
+        - timeout (float): The longest to wait in seconds, or None to wait for
+        all n items.
+
+        Returns:
+        - list: The removed items, front first; empty if none arrived in time.
+        """
+        wanted = min(n, self._most()) if self._most() else n
+        try:
+            async with asyncio.timeout(timeout):
+                while len(self.items) < wanted:
+                    await self._wait(self._batchers, lambda: False)
+        except TimeoutError:
+            pass
+        items = self._pop_many(n)
+        for _ in items:
+            self._wake_next(self._putters)
+        return items
+
+    def task_done(self):
+        """
+        Mark an item taken from the queue as processed.
+
+        Raises:
+        - ValueError: If called more times than items were put.
+        """
+        if self._unfinished <= 0:
+            raise ValueError("task_done() called too many times")
+        self._unfinished -= 1
+        if self._unfinished == 0:
+            self._finished.set()
+
+    async def join(self):
+        """
+        Wait until every item put has been marked done with task_done.
+        """
+        await self._finished.wait()
+
+
+class AsyncDeque(AsyncQueue):
+    """
+    An AsyncQueue that can also be added to at the front and taken from at
+    the rear, e.g. for pushing urgent work ahead of the backlog.
+    """
+
+    def put_front_nowait(self, item):
+        """
+        Add an item to the front of the deque without waiting.
+
+        Parameters:
+        - item: The item to add.
+
+        Raises:
+        - OverflowError: If the deque is full.
+        """
+        if self.is_full():
+            raise OverflowError("put to a full deque")
+        self.items.addFront(item)
+        self._added(0)
+
+    async def put_front(self, item, timeout=None):
+        """
+        Add an item to the front of the deque, waiting for room if it is full.
+
+        Parameters:
+        - item: The item to add.
+        - timeout (float): The longest to wait in seconds, or None to wait
+        forever.
+
+        Raises:
+        - TimeoutError: If the deque is still full after timeout seconds.
+        """
+        await self._room(timeout)
+        self.put_front_nowait(item)
+
+    def get_rear_nowait(self):
+        """
+        Remove and return the item at the rear of the deque without waiting.
+
+        Returns:
+        - item: The item at the rear of the deque.
+
+        Raises:
+        - IndexError: If the deque is empty.
+        """
+        if self.is_empty():
+            raise IndexError("get from an empty deque")
+        item = self.items.removeRear()
+        self._wake_next(self._putters)
+        return item
+
+    async def get_rear(self, timeout=None):
+        """
+        Remove and return the item at the rear of the deque, waiting for one if
+        it is empty.
+
+        Parameters:
+        - timeout (float): The longest to wait in seconds, or None to wait
+        forever.
+
+        Returns:
+        - item: The item at the rear of the deque.
+
+        Raises:
+        - TimeoutError: If the deque is still empty after timeout seconds.
+        """
+        await self._item(timeout)
+        return self.get_rear_nowait()
+
+
+class AsyncCircularQueue(AsyncQueue):
+    """
+    An AsyncQueue stored in a CircularQueue, taking the same overflow policy.
+
+    With "error" the queue is bounded by its capacity and put waits for room;
+    with "grow" it is unbounded; with "overwrite" put never waits and evicts
+    the oldest item instead, which no longer counts towards join.
+    """
+
+    def __init__(self, capacity, overflow="error"):
+        """
+        Initialize an empty circular queue.
+
+        Parameters:
+        - capacity (int): The initial number of slots.
+        - overflow (str): One of "error", "grow" or "overwrite"; see
+        CircularQueue.
+        """
+        super().__init__(capacity if overflow == "error" else 0)
+        self.items = CircularQueue(capacity, overflow)
+
+    def _most(self):
+        if self.items.overflow == "grow":
+            return 0
+        return self.items.capacity
+
+    def _push(self, item):
+        evicted = int(self.items.overflow == "overwrite" and self.items.isFull())
+        self.items.enqueue(item)
+        return evicted
+
+    def _pop(self):
+        return self.items.dequeue()
+
+    def _pop_many(self, n):
+        return self.items.dequeueMany(n)
+
+
+if __name__ == "__main__":
+    # Example Usage
+    async def main():
+        queue = AsyncQueue(maxsize=4)
+
+        async def consume():
+            while True:
+                batch = await queue.get_many(3, timeout=0.05)
+                print("Consumed batch:", batch)
+                for _ in batch:
+                    queue.task_done()
+
+        consumer = asyncio.create_task(consume())
+        for i in range(10):
+            await queue.put(i)
+        await queue.join()
+        consumer.cancel()
+
+        deque = AsyncDeque()
+        await deque.put(1)
+        await deque.put_front(0)
+        print("Front:", await deque.get(), "Rear:", await deque.get_rear())
+
+        recent = AsyncCircularQueue(3, overflow="overwrite")
+        for i in range(5):
+            await recent.put(i)
+        print("Recent:", await recent.get_many(3))
+
+    asyncio.run(main())
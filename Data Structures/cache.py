@@ -0,0 +1,313 @@
+import time
+
+from hash_table import HashTable
+from linked_list import DoublyLinkedList, DoublyNode
+
+
+class CacheEntry:
+    """
+    A class representing one cached value.
+
+    Attributes:
+        key: The key the value is cached under.
+        value: The cached value.
+        weight: The weight the entry counts for against max_weight.
+        expires: The timer value after which the entry is stale, or None.
+        frequency: The number of times the entry was used (LFU only).
+    """
+
+    __slots__ = ("key", "value", "weight", "expires", "frequency")
+
+    def __init__(self, key, value, weight, expires) -> None:
+        self.key = key
+        self.value = value
+        self.weight = weight
+        self.expires = expires
+        self.frequency = 1
+
+
+class Cache:
+    """
+    A bounded cache with O(1) get, put and eviction.
+
+    A HashTable maps every key to a node of a DoublyLinkedList, so an entry can
+    be found, moved and unlinked without walking any list.
+
+    Eviction policies:
+        1.lru: one list ordered from least to most recently used. A hit moves
+        the node to the tail and the head is evicted.
+        2.lfu: one list per use count, each ordered by recency. A hit moves the
+        node to the list of the next count and the head of the list with the
+        lowest count is evicted, so ties go to the least recently used entry.
+
+    Entries may expire after a time to live. Expired entries are dropped
+    lazily, when they are next looked up or reach the eviction end of a list.
+    The cache can be bounded by the number of entries, by the total weight of
+    the entries or both, and it counts hits, misses, evictions and expirations
+    so that its capacity can be tuned.
+    """
+
+    POLICIES = ("lru", "lfu")
+
+    def __init__(
+        self,
+        capacity=None,
+        policy="lru",
+        ttl=None,
+        max_weight=None,
+        weigher=None,
+        timer=time.monotonic,
+    ) -> None:
+        """
+        Initialize the Cache object.
+
+        Parameters:
+        - capacity (int): The maximum number of entries, or None for no limit.
+        - policy (str): The eviction policy, "lru" or "lfu".
+        - ttl (float): The default time to live of an entry in timer units
+        (seconds by default), or None for entries that never expire.
+        - max_weight (float): The maximum total weight, or None for no limit.
+        - weigher (callable): Returns the weight of a (key, value) pair. Every
+        entry weighs 1 by default.
+        - timer (callable): Returns the current time.
+
+        Raises:
+        - ValueError: If the policy is unknown, no bound is given, capacity
+        is less than 1 or max_weight is not positive.
+        """
+        if policy not in self.POLICIES:
+            raise ValueError(f"Unknown eviction policy: {policy}")
+        if capacity is None and max_weight is None:
+            raise ValueError("A cache needs a capacity, a max_weight or both")
+        if capacity is not None and capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        if max_weight is not None and max_weight <= 0:
+            raise ValueError("max_weight must be positive")
+        self.capacity = capacity
+        self.policy = policy
+        self.ttl = ttl
+        self.max_weight = max_weight
+        self.weigher = weigher
+        self.timer = timer
+        self.nodes = HashTable(16, 0.75)
+        # LRU keeps one recency list under frequency 1; LFU keeps one per count.
+        self.lists = HashTable(8, 0.75)
+        self.min_frequency = 1
+        self.weight = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __len__(self):
+        """
+        Return the number of entries, including expired ones not yet dropped.
+        """
+        return len(self.nodes)
+
+    def __contains__(self, key):
+        """
+        Check whether a fresh entry is cached under the given key, without
+        counting a hit or a miss.
+        """
+        n = self.nodes.get(key)
+        return n is not None and not self._expired(n.data)
+
+    def _expired(self, entry):
+        """
+        Check whether the given entry has outlived its time to live.
+        """
+        return entry.expires is not None and entry.expires <= self.timer()
+
+    def _link(self, n):
+        """
+        Append a node to the tail of the list for its entry's use count.
+        """
+        frequency = n.data.frequency
+        recency = self.lists.get(frequency)
+        if recency is None:
+            recency = self.lists[frequency] = DoublyLinkedList()
+        recency.appendNode(n)
+
+    def _unlink(self, n):
+        """
+        Remove a node from the list for its entry's use count, dropping the
+        list if that leaves it empty.
+        """
+        frequency = n.data.frequency
+        recency = self.lists[frequency]
+        recency.removeNode(n)
+        if recency.size == 0:
+            del self.lists[frequency]
+
+    def _touch(self, n):
+        """
+        Record a use of the given node.
+        """
+        self._unlink(n)
+        if self.policy == "lfu":
+            entry = n.data
+            if entry.frequency == self.min_frequency and entry.frequency not in self.lists:
+                self.min_frequency += 1
+            entry.frequency += 1
+        self._link(n)
+
+    def _remove(self, n):
+        """
+        Drop the given node from the cache entirely.
+        """
+        self._unlink(n)
+        del self.nodes[n.data.key]
+        self.weight -= n.data.weight
+
+    def _evict(self):
+        """
+        Drop the entry at the eviction end of the cache. Expired entries are
+        counted as expirations rather than evictions.
+        """
+        if self.min_frequency not in self.lists:
+            # A delete or expiry emptied the lowest list; find the new one.
+            self.min_frequency = min(self.lists)
+        n = self.lists[self.min_frequency].header
+        self._remove(n)
+        if self._expired(n.data):
+            self.expirations += 1
+        else:
+            self.evictions += 1
+
+    def _fits(self, count, weight):
+        """
+        Check whether the given number of entries and total weight are within
+        the bounds of the cache.
+        """
+        if self.capacity is not None and count > self.capacity:
+            return False
+        return self.max_weight is None or weight <= self.max_weight
+
+    def get(self, key, default=None):
+        """
+        Retrieve the value cached under the given key.
+
+        Parameters:
+        - key: The key to look up.
+        - default: The value returned on a miss.
+
+        Returns:
+        - value: The cached value, or default if it is missing or expired.
+        """
+        n = self.nodes.get(key)
+        if n is None:
+            self.misses += 1
+            return default
+        if self._expired(n.data):
+            self._remove(n)
+            self.expirations += 1
+            self.misses += 1
+            return default
+        self.hits += 1
+        self._touch(n)
+        return n.data.value
+
+    def put(self, key, value, ttl=None):
+        """
+        Cache a value, evicting other entries as needed to stay within bounds.
+
+        Parameters:
+        - key: The key to cache the value under.
+        - value: The value to cache.
+        - ttl (float): The time to live of this entry, overriding the default.
+
+        Raises:
+        - ValueError: If the entry alone is heavier than max_weight.
+        """
+        weight = 1 if self.weigher is None else self.weigher(key, value)
+        if self.max_weight is not None and weight > self.max_weight:
+            raise ValueError(f"Entry for {key} is heavier than max_weight")
+        if ttl is None:
+            ttl = self.ttl
+        expires = None if ttl is None else self.timer() + ttl
+
+        n = self.nodes.get(key)
+        if n is not None:
+            entry = n.data
+            self.weight += weight - entry.weight
+            entry.value = value
+            entry.weight = weight
+            entry.expires = expires
+            self._touch(n)
+            # The entry may have grown; shed entries until the cache fits.
+            while not self._fits(len(self.nodes), self.weight):
+                self._evict()
+            return
+
+        while len(self.nodes) and not self._fits(len(self.nodes) + 1, self.weight + weight):
+            self._evict()
+        n = DoublyNode(CacheEntry(key, value, weight, expires))
+        self.nodes[key] = n
+        self.weight += weight
+        self.min_frequency = 1
+        self._link(n)
+
+    def delete(self, key):
+        """
+        Remove the entry cached under the given key, if there is one.
+
+        Returns:
+        - bool: True if an entry was removed, False otherwise.
+        """
+        n = self.nodes.get(key)
+        if n is None:
+            return False
+        self._remove(n)
+        return True
+
+    def clear(self):
+        """
+        Remove every entry. The statistics are kept.
+        """
+        self.nodes.clear()
+        self.lists.clear()
+        self.min_frequency = 1
+        self.weight = 0
+
+    def stats(self):
+        """
+        Return the cache statistics.
+
+        Returns:
+        - dict: hits, misses, evictions, expirations, hit_rate, size and weight.
+        """
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "size": len(self.nodes),
+            "weight": self.weight,
+        }
+
+
+# Example Usage
+if __name__ == "__main__":
+    lru = Cache(capacity=2)
+    lru.put("a", 1)
+    lru.put("b", 2)
+    lru.get("a")
+    lru.put("c", 3)  # evicts "b", the least recently used
+    print("b" in lru, lru.get("a"), lru.stats())
+
+    lfu = Cache(capacity=2, policy="lfu")
+    lfu.put("a", 1)
+    lfu.put("b", 2)
+    lfu.get("a")
+    lfu.get("a")
+    lfu.get("b")
+    lfu.put("c", 3)  # evicts "b", the least frequently used
+    print("b" in lfu, lfu.get("a"), lfu.stats())
+
+    sized = Cache(max_weight=10, weigher=lambda key, value: len(value), ttl=60)
+    sized.put("x", "12345")
+    sized.put("y", "123456")  # evicts "x" to stay within 10 characters
+    print(list(sized.nodes), sized.weight)
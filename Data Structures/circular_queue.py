@@ -1,18 +1,68 @@
 class CircularQueue:
     """
     A circular queue is the extended version of a regular queue where the last element is connected to the first element. Thus forming a circle-like structure.
+
+    The elements live in a fixed list of capacity slots: head is the slot of
+    the front element and the rest follow it, wrapping around the end of the
+    list. What happens when an element is added to a full queue depends on the
+    overflow policy:
+
+    - "error": raise OverflowError and leave the queue unchanged.
+    - "grow": double the capacity, keeping the elements in order.
+    - "overwrite": evict the oldest element to make room.
+
+    Attributes:
+        queue: The list of slots holding the elements.
+        head: The slot of the front element.
+        count: The number of elements in the queue.
+        capacity: The number of slots.
+        overflow: The overflow policy.
     """
 
-    def __init__(self, capacity: int) -> None:
+    OVERFLOW_POLICIES = ("error", "grow", "overwrite")
+
+    def __init__(self, capacity: int, overflow: str = "error") -> None:
         """
         Initialize CircularQueue with a specified capacity.
 
         Args:
             capacity (int): The maximum capacity of the circular queue.
+            overflow (str): What to do when adding to a full queue; one of
+                "error", "grow" or "overwrite".
+
+        Raises:
+            ValueError: If capacity is not positive or overflow is unknown.
         """
+        if capacity < 1:
+            raise ValueError("capacity must be positive")
+        if overflow not in self.OVERFLOW_POLICIES:
+            raise ValueError(
+                f"overflow must be one of {', '.join(self.OVERFLOW_POLICIES)}"
+            )
         self.capacity = capacity
+        self.overflow = overflow
         self.queue = [None] * capacity
-        self.head = self.tail = -1
+        self.head = 0
+        self.count = 0
+
+    @property
+    def tail(self) -> int:
+        """
+        The slot of the rear element, or -1 if the queue is empty.
+        """
+        if self.count == 0:
+            return -1
+        return (self.head + self.count - 1) % self.capacity
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __iter__(self):
+        """
+        Yield the elements from front to rear.
+        """
+        for i in range(self.count):
+            yield self.queue[(self.head + i) % self.capacity]
 
     def isEmpty(self) -> bool:
         """
@@ -21,7 +71,7 @@ class CircularQueue:
         Returns:
             bool: True if the circular queue is empty, False otherwise.
         """
-        return self.head == -1 and self.tail == -1
+        return self.count == 0
 
     def isFull(self) -> bool:
         """
@@ -30,37 +80,138 @@ class CircularQueue:
         Returns:
             bool: True if the circular queue is full, False otherwise.
         """
-        return (self.tail + 1) % self.capacity == self.head
+        return self.count == self.capacity
+
+    def _resize(self, capacity: int) -> None:
+        """
+        Move the elements, in order, to the start of a list with the given
+        number of slots.
+        """
+        end = self.head + self.count
+        if end <= self.capacity:
+            items = self.queue[self.head:end]
+        else:
+            items = self.queue[self.head:] + self.queue[: end - self.capacity]
+        self.queue = items + [None] * (capacity - self.count)
+        self.capacity = capacity
+        self.head = 0
+
+    def _makeRoom(self, n: int) -> None:
+        """
+        Apply the overflow policy so that n more elements fit.
+
+        Raises:
+            OverflowError: If the policy is "error" and n elements do not fit.
+        """
+        if self.count + n <= self.capacity:
+            return
+        if self.overflow == "grow":
+            capacity = self.capacity << 1
+            while capacity < self.count + n:
+                capacity <<= 1
+            self._resize(capacity)
+        elif self.overflow == "overwrite":
+            self._drop(self.count + n - self.capacity)
+        else:
+            raise OverflowError("enqueue to a full circular queue")
+
+    def _drop(self, n: int) -> None:
+        """
+        Discard the n oldest elements.
+        """
+        end = self.head + n
+        if end <= self.capacity:
+            self.queue[self.head:end] = [None] * n
+        else:
+            self.queue[self.head:] = [None] * (self.capacity - self.head)
+            self.queue[: end - self.capacity] = [None] * (end - self.capacity)
+        self.head = end % self.capacity
+        self.count -= n
 
     def enqueue(self, data) -> None:
         """
-        Add an element to the circular queue.
+        Add an element to the rear of the circular queue.
 
         Args:
             data: The data to be added to the circular queue.
+
+        Raises:
+            OverflowError: If the queue is full and the policy is "error".
         """
-        if self.isFull():
-            print("The queue is full")
-        elif self.head == -1:
+        if self.count == self.capacity:
+            self._makeRoom(1)
+        self.queue[(self.head + self.count) % self.capacity] = data
+        self.count += 1
+
+    def enqueueMany(self, items) -> None:
+        """
+        Add elements to the rear of the circular queue, in order. They are
+        copied in at most two slices rather than one slot at a time.
+
+        With the "error" policy either all of the elements are added or, if
+        they do not fit, none are. With "overwrite" only the last capacity
+        elements are kept if there are more than that.
+
+        Args:
+            items: An iterable of the data to be added.
+
+        Raises:
+            OverflowError: If the elements do not fit and the policy is "error".
+        """
+        if not isinstance(items, (list, tuple)):
+            items = list(items)
+        n = len(items)
+        if n > self.capacity and self.overflow == "overwrite":
+            self.queue = list(items[n - self.capacity:])
             self.head = 0
-            self.tail = 0
-            self.queue[self.tail] = data
-        else:
-            self.tail = (self.tail + 1) % self.capacity
-            self.queue[self.tail] = data
+            self.count = self.capacity
+            return
+        self._makeRoom(n)
+        tail = (self.head + self.count) % self.capacity
+        first = min(n, self.capacity - tail)
+        self.queue[tail:tail + first] = items[:first]
+        self.queue[: n - first] = items[first:]
+        self.count += n
 
-    def dequeue(self) -> None:
+    def dequeue(self):
         """
-        Remove an element from the front of the circular queue.
+        Remove and return the element at the front of the circular queue.
+
+        Returns:
+            The element at the front of the circular queue.
+
+        Raises:
+            IndexError: If the queue is empty.
         """
-        if self.isEmpty():
-            print("The queue is empty")
-        elif self.head == self.tail:
-            self.queue[self.head] = None
-            self.head = self.tail = -1
+        if self.count == 0:
+            raise IndexError("dequeue from an empty circular queue")
+        data = self.queue[self.head]
+        self.queue[self.head] = None
+        self.head = (self.head + 1) % self.capacity
+        self.count -= 1
+        return data
+
+    def dequeueMany(self, n: int) -> list:
+        """
+        Remove and return up to n elements from the front of the circular
+        queue. They are copied out in at most two slices rather than one slot
+        at a time.
+
+        Args:
+            n (int): The largest number of elements to remove.
+
+        Returns:
+            list: The removed elements, front first; shorter than n if the
+                queue held fewer elements.
+        """
+        n = max(0, min(n, self.count))
+        end = self.head + n
+        if end <= self.capacity:
+            items = self.queue[self.head:end]
         else:
-            self.queue[self.head] = None
-            self.head = (self.head + 1) % self.capacity
+            items = self.queue[self.head:] + self.queue[: end - self.capacity]
+        self._drop(n)
+        return items
 
     def printQueue(self) -> None:
         """
@@ -69,7 +220,7 @@ class CircularQueue:
         if self.isEmpty():
             print("The queue is Empty")
         else:
-            print(self.queue)
+            print(list(self))
 
     def peek(self):
         """
@@ -79,31 +230,38 @@ class CircularQueue:
             The element at the front of the circular queue, or None if the queue is empty.
         """
         if self.isEmpty():
-            print("The queue is Empty")
             return None
         return self.queue[self.head]
 
     def clear(self):
         """
-        Clear the circular queue, removing all elements from it.
+        Clear the circular queue, removing all elements from it. The slots are
+        reused rather than reallocated.
         """
-        if self.isEmpty():
-            print("The queue is Empty")
-            return None
-        self.queue = [None] * self.capacity
-
-
-# Example Usage
-circular_queue = CircularQueue(10)
-print("is queue empty: ", circular_queue.isEmpty())
-print("is queue full? ", circular_queue.isFull())
-circular_queue.enqueue(1)
-circular_queue.enqueue(2)
-circular_queue.enqueue(3)
-circular_queue.printQueue()
-print("is queue full? ", circular_queue.isFull())
-circular_queue.dequeue()
-circular_queue.printQueue()
-print("is queue full? ", circular_queue.isFull())
-circular_queue.enqueue(4)
-circular_queue.printQueue()
+        self._drop(self.count)
+        self.head = 0
+
+
+if __name__ == "__main__":
+    # Example Usage
+    circular_queue = CircularQueue(10)
+    print("is queue empty: ", circular_queue.isEmpty())
+    print("is queue full? ", circular_queue.isFull())
+    circular_queue.enqueue(1)
+    circular_queue.enqueue(2)
+    circular_queue.enqueue(3)
+    circular_queue.printQueue()
+    print("is queue full? ", circular_queue.isFull())
+    print("dequeued: ", circular_queue.dequeue())
+    circular_queue.printQueue()
+    print("is queue full? ", circular_queue.isFull())
+    circular_queue.enqueue(4)
+    circular_queue.printQueue()
+    circular_queue.enqueueMany(range(5, 12))
+    circular_queue.printQueue()
+    print("dequeued: ", circular_queue.dequeueMany(4))
+    circular_queue.printQueue()
+
+    recent = CircularQueue(3, overflow="overwrite")
+    recent.enqueueMany(range(1, 6))
+    recent.printQueue()
@@ -0,0 +1,190 @@
+from collections.abc import MutableMapping
+from threading import Lock
+
+from hash_table import HashTable
+
+# Fibonacci hashing multiplier. Shards are picked from the high bits of the
+# product so that the choice of shard is independent of the low bits each
+# shard uses to pick a bucket.
+_SPREAD = 0x9E3779B97F4A7C15
+_MASK = (1 << 64) - 1
+
+_MISSING = object()
+
+
+class ConcurrentHashTable(MutableMapping):
+    """
+    A thread-safe hash table made of independently locked shards (lock
+    striping).
+
+    Every key belongs to exactly one shard, a plain HashTable guarded by its own
+    lock. Operations on different shards never wait for each other, and a
+    resize only rebuilds (and only locks) the shard that outgrew its threshold,
+    so a growing table never stalls readers of the other shards.
+
+    Iteration is weakly consistent: each shard is copied under its lock as the
+    iterator reaches it, so it never fails because of concurrent writes, but
+    it may or may not reflect changes made after it started.
+    """
+
+    def __init__(
+        self, shards=16, size=8, load_factor=0.75, table_class=HashTable, **kwargs
+    ) -> None:
+        """
+        Initialize the ConcurrentHashTable object.
+
+        Parameters:
+        - shards (int): The number of independently locked shards.
+        - size (int): The initial size of each shard.
+        - load_factor (float): The load factor threshold for resizing a shard.
+        - table_class (type): The hash table class used for each shard.
+        - kwargs: Any other option of table_class, such as hash_function.
+        """
+        if shards < 1:
+            raise ValueError("shards must be at least 1")
+        self.shards = [table_class(size, load_factor, **kwargs) for _ in range(shards)]
+        self.locks = [Lock() for _ in range(shards)]
+        self.hash_function = self.shards[0].hash_function
+
+    def _shard_index(self, key):
+        """
+        Return the index of the shard that owns the given key.
+        """
+        h = self.hash_function(key)
+        return ((h * _SPREAD & _MASK) >> 32) % len(self.shards)
+
+    def __setitem__(self, key, value):
+        """
+        Insert a key-value pair into the owning shard.
+
+        Parameters:
+        - key (str): The key to insert.
+        - value: The value associated with the key.
+        """
+        index = self._shard_index(key)
+        with self.locks[index]:
+            self.shards[index][key] = value
+
+    def __getitem__(self, key):
+        """
+        Retrieve the value associated with the given key.
+
+        Parameters:
+        - key (str): The key to retrieve the value for.
+
+        Returns:
+        - value: The value associated with the key.
+
+        Raises:
+        - KeyError: If the key is not found in the hash table.
+        """
+        index = self._shard_index(key)
+        with self.locks[index]:
+            return self.shards[index][key]
+
+    def __delitem__(self, key):
+        """
+        Delete the key-value pair with the given key.
+
+        Parameters:
+        - key (str): The key to delete.
+
+        Raises:
+        - KeyError: If the key is not found in the hash table.
+        """
+        index = self._shard_index(key)
+        with self.locks[index]:
+            del self.shards[index][key]
+
+    def __contains__(self, key):
+        """
+        Check whether the given key is in the hash table.
+        """
+        index = self._shard_index(key)
+        with self.locks[index]:
+            return key in self.shards[index]
+
+    def get(self, key, default=None):
+        """
+        Retrieve the value for the given key, or default if it is missing.
+        """
+        index = self._shard_index(key)
+        with self.locks[index]:
+            return self.shards[index].get(key, default)
+
+    def setdefault(self, key, default=None):
+        """
+        Atomically return the value of the given key, inserting default first
+        if the key is missing.
+        """
+        index = self._shard_index(key)
+        with self.locks[index]:
+            shard = self.shards[index]
+            entry = shard._find(key)
+            if entry is not None:
+                return entry[2]
+            shard[key] = default
+            return default
+
+    def pop(self, key, default=_MISSING):
+        """
+        Atomically remove the given key and return its value.
+
+        Raises:
+        - KeyError: If the key is missing and no default is given.
+        """
+        index = self._shard_index(key)
+        with self.locks[index]:
+            shard = self.shards[index]
+            entry = shard._find(key)
+            if entry is None:
+                if default is _MISSING:
+                    raise KeyError(f"Key({key}) not found in the hash table")
+                return default
+            del shard[key]
+            return entry[2]
+
+    def __len__(self):
+        """
+        Return the number of key-value pairs, summed shard by shard.
+        """
+        total = 0
+        for lock, shard in zip(self.locks, self.shards):
+            with lock:
+                total += len(shard)
+        return total
+
+    def __iter__(self):
+        """
+        Return a weakly consistent iterator over the keys.
+        """
+        for lock, shard in zip(self.locks, self.shards):
+            with lock:
+                keys = list(shard)
+            yield from keys
+
+    def clear(self):
+        """
+        Clear every shard.
+        """
+        for lock, shard in zip(self.locks, self.shards):
+            with lock:
+                shard.clear()
+
+
+if __name__ == "__main__":
+    from threading import Thread
+
+    table = ConcurrentHashTable(shards=4)
+
+    def writer(start):
+        for i in range(start, start + 1000):
+            table[f"key{i}"] = i
+
+    threads = [Thread(target=writer, args=(n * 1000,)) for n in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    print(len(table), table["key2500"], table.setdefault("key2500", 0))
+    print([len(shard) for shard in table.shards])
@@ -0,0 +1,83 @@
+# Benchmark: ConcurrentHashTable throughput as the number of threads grows
+
+import random
+import sys
+import time
+from threading import Barrier, Lock, Thread
+
+from concurrent_hash_table import ConcurrentHashTable
+from hash_table import HashTable
+
+
+class GlobalLockHashTable:
+    """
+    Baseline: one HashTable behind a single lock.
+    """
+
+    def __init__(self) -> None:
+        self.table = HashTable(8, 0.75)
+        self.lock = Lock()
+
+    def __setitem__(self, key, value):
+        with self.lock:
+            self.table[key] = value
+
+    def get(self, key, default=None):
+        with self.lock:
+            return self.table.get(key, default)
+
+
+def worker(table, keys, ops, write_ratio, barrier, seed):
+    """
+    Run a random mix of reads and writes against the table.
+    """
+    rng = random.Random(seed)
+    picks = [rng.choice(keys) for _ in range(ops)]
+    writes = [rng.random() < write_ratio for _ in range(ops)]
+    barrier.wait()
+    for key, write in zip(picks, writes):
+        if write:
+            table[key] = 1
+        else:
+            table.get(key)
+
+
+def throughput(factory, threads, keys, ops, write_ratio):
+    """
+    Return the operations per second reached by the given number of threads,
+    each running ops operations against a fresh table.
+    """
+    table = factory()
+    for key in keys[: len(keys) // 2]:
+        table[key] = 0
+    barrier = Barrier(threads + 1)
+    pool = [
+        Thread(target=worker, args=(table, keys, ops, write_ratio, barrier, seed))
+        for seed in range(threads)
+    ]
+    for thread in pool:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in pool:
+        thread.join()
+    return threads * ops / (time.perf_counter() - start)
+
+
+def main(ops=100_000, write_ratio=0.2):
+    keys = [f"key-{i}" for i in range(100_000)]
+    candidates = [
+        ("global lock", GlobalLockHashTable),
+        ("16 shards", lambda: ConcurrentHashTable(shards=16)),
+        ("64 shards", lambda: ConcurrentHashTable(shards=64)),
+    ]
+    print(f"{ops} ops per thread, {write_ratio:.0%} writes")
+    print(f"{'table':<14}{'threads':>8}{'ops/sec':>14}")
+    for name, factory in candidates:
+        for threads in (1, 2, 4, 8):
+            rate = throughput(factory, threads, keys, ops, write_ratio)
+            print(f"{name:<14}{threads:>8}{rate:>14,.0f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
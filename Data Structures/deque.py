@@ -2,15 +2,59 @@ class Deque:
     """
     A double-ended queue (deque) implementation in Python.
 
+    Elements live in a growable circular buffer: head is the slot of the front
+    element and the rest follow it, wrapping around the end of the buffer. Both
+    ends are therefore reached by index arithmetic, and adding or removing at
+    either end is O(1) amortized instead of shifting the whole list. The buffer
+    capacity is a power of two, so wrapping is a bit mask; it doubles when full
+    and halves when it falls to a quarter full.
+
+    With maxlen set the deque is bounded: adding to a full deque discards an
+    element from the opposite end, like collections.deque.
+
     Attributes:
-    - queue: A list to store elements in the deque.
+    - buffer: The circular buffer holding the elements.
+    - head: The index in buffer of the front element.
+    - count: The number of elements in the deque.
+    - maxlen: The maximum number of elements, or None if unbounded.
     """
 
-    def __init__(self) -> None:
+    MIN_CAPACITY = 8
+
+    def __init__(self, maxlen=None) -> None:
         """
         Initializes an empty deque.
+
+        Args:
+        - maxlen: The maximum number of elements, or None for no limit.
+        """
+        if maxlen is not None and maxlen < 0:
+            raise ValueError("maxlen must be non-negative")
+        self.buffer = [None] * self.MIN_CAPACITY
+        self.head = 0
+        self.count = 0
+        self.maxlen = maxlen
+
+    def _resize(self, capacity):
+        """
+        Moves the elements, in order, to the start of a buffer with the given
+        capacity.
+        """
+        end = self.head + self.count
+        if end <= len(self.buffer):
+            items = self.buffer[self.head:end]
+        else:
+            items = self.buffer[self.head:] + self.buffer[: end - len(self.buffer)]
+        self.buffer = items + [None] * (capacity - self.count)
+        self.head = 0
+
+    def _shrink(self):
         """
-        self.queue = []
+        Halves the buffer if it has fallen to a quarter full.
+        """
+        capacity = len(self.buffer)
+        if capacity > self.MIN_CAPACITY and self.count <= capacity >> 2:
+            self._resize(capacity >> 1)
 
     def isEmpty(self) -> bool:
         """
@@ -19,25 +63,42 @@ class Deque:
         Returns:
         - True if the deque is empty, False otherwise.
         """
-        return len(self.queue) == 0
+        return self.count == 0
 
     def addRear(self, data) -> None:
         """
-        Adds an element to the rear end of the deque.
+        Adds an element to the rear end of the deque. If the deque is at maxlen,
+        the front element is discarded.
 
         Args:
         - data: The element to be added.
         """
-        self.queue.append(data)
+        if self.count == self.maxlen:
+            if self.maxlen == 0:
+                return
+            self.removeFront()
+        if self.count == len(self.buffer):
+            self._resize(self.count << 1)
+        self.buffer[(self.head + self.count) & (len(self.buffer) - 1)] = data
+        self.count += 1
 
     def addFront(self, data) -> None:
         """
-        Adds an element to the front end of the deque.
+        Adds an element to the front end of the deque. If the deque is at
+        maxlen, the rear element is discarded.
 
         Args:
         - data: The element to be added.
         """
-        self.queue.insert(0, data)
+        if self.count == self.maxlen:
+            if self.maxlen == 0:
+                return
+            self.removeRear()
+        if self.count == len(self.buffer):
+            self._resize(self.count << 1)
+        self.head = (self.head - 1) & (len(self.buffer) - 1)
+        self.buffer[self.head] = data
+        self.count += 1
 
     def removeRear(self):
         """
@@ -45,8 +106,18 @@ class Deque:
 
         Returns:
         - The element removed from the rear end of the deque.
+
+        Raises:
+        - IndexError: If the deque is empty.
         """
-        return self.queue.pop()
+        if self.count == 0:
+            raise IndexError("pop from an empty deque")
+        self.count -= 1
+        index = (self.head + self.count) & (len(self.buffer) - 1)
+        data = self.buffer[index]
+        self.buffer[index] = None
+        self._shrink()
+        return data
 
     def removeFront(self):
         """
@@ -54,8 +125,18 @@ class Deque:
 
         Returns:
         - The element removed from the front end of the deque.
+
+        Raises:
+        - IndexError: If the deque is empty.
         """
-        return self.queue.pop(0)
+        if self.count == 0:
+            raise IndexError("pop from an empty deque")
+        data = self.buffer[self.head]
+        self.buffer[self.head] = None
+        self.head = (self.head + 1) & (len(self.buffer) - 1)
+        self.count -= 1
+        self._shrink()
+        return data
 
     def size(self) -> int:
         """
@@ -64,22 +145,72 @@ class Deque:
         Returns:
         - The number of elements in the deque.
         """
-        return len(self.queue)
+        return self.count
 
+    def __len__(self) -> int:
+        return self.count
 
-# Example Usage
+    def _slot(self, index) -> int:
+        """
+        Returns the buffer slot of the element at the given index, where
+        negative indices count from the rear.
+
+        Raises:
+        - IndexError: If the index is out of range.
+        """
+        if index < 0:
+            index += self.count
+        if index < 0 or index >= self.count:
+            raise IndexError("deque index out of range")
+        return (self.head + index) & (len(self.buffer) - 1)
 
-d = Deque()
-print(d.isEmpty())
-d.addRear(8)
-d.addRear(5)
-d.addFront(7)
-d.addFront(10)
-print(d.size())
-print(d.isEmpty())
-d.addRear(11)
-print(d.removeRear())
-print(d.removeFront())
-d.addFront(55)
-d.addRear(45)
-print(d.queue)
\ No newline at end of file
+    def __getitem__(self, index):
+        """
+        Returns the element at the given index in O(1).
+        """
+        return self.buffer[self._slot(index)]
+
+    def __setitem__(self, index, data):
+        """
+        Replaces the element at the given index in O(1).
+        """
+        self.buffer[self._slot(index)] = data
+
+    def __iter__(self):
+        """
+        Yields the elements from front to rear.
+        """
+        buffer = self.buffer
+        mask = len(buffer) - 1
+        for offset in range(self.count):
+            yield buffer[(self.head + offset) & mask]
+
+    @property
+    def queue(self) -> list:
+        """
+        A list of the elements from front to rear.
+        """
+        return list(self)
+
+
+# Example Usage
+if __name__ == "__main__":
+    d = Deque()
+    print(d.isEmpty())
+    d.addRear(8)
+    d.addRear(5)
+    d.addFront(7)
+    d.addFront(10)
+    print(d.size())
+    print(d.isEmpty())
+    d.addRear(11)
+    print(d.removeRear())
+    print(d.removeFront())
+    d.addFront(55)
+    d.addRear(45)
+    print(d.queue, d[0], d[-1])
+
+    window = Deque(maxlen=3)
+    for i in range(5):
+        window.addRear(i)
+    print(window.queue)
@@ -0,0 +1,81 @@
+# Benchmark: ring-buffer Deque vs the previous list-backed deque
+
+import time
+
+from deque import Deque
+
+
+class ListDeque:
+    """
+    The previous Deque: a plain list with insert(0, ...) and pop(0) at the
+    front.
+    """
+
+    def __init__(self) -> None:
+        self.queue = []
+
+    def addRear(self, data) -> None:
+        self.queue.append(data)
+
+    def addFront(self, data) -> None:
+        self.queue.insert(0, data)
+
+    def removeRear(self):
+        return self.queue.pop()
+
+    def removeFront(self):
+        return self.queue.pop(0)
+
+
+def fifo(deque, n):
+    """
+    Fill the deque at the rear, then drain it from the front.
+    """
+    for i in range(n):
+        deque.addRear(i)
+    for _ in range(n):
+        deque.removeFront()
+
+
+def front_stack(deque, n):
+    """
+    Push and pop n elements at the front.
+    """
+    for i in range(n):
+        deque.addFront(i)
+    for _ in range(n):
+        deque.removeFront()
+
+
+def work_stealing(deque, n):
+    """
+    Owner pushes and pops at the rear while a thief steals from the front,
+    with a standing backlog of n elements.
+    """
+    for i in range(n):
+        deque.addRear(i)
+    for i in range(n):
+        deque.addRear(i)
+        deque.removeRear()
+        deque.removeFront()
+        deque.addRear(i)
+
+
+def seconds(workload, factory, n):
+    start = time.perf_counter()
+    workload(factory(), n)
+    return time.perf_counter() - start
+
+
+def main():
+    workloads = [("fifo", fifo), ("front stack", front_stack), ("work stealing", work_stealing)]
+    print(f"{'workload':<15}{'n':>9}{'list (s)':>11}{'ring (s)':>11}")
+    for n in (10_000, 100_000):
+        for name, workload in workloads:
+            old = seconds(workload, ListDeque, n)
+            new = seconds(workload, Deque, n)
+            print(f"{name:<15}{n:>9}{old:>11.3f}{new:>11.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,135 @@
+import gc
 import hashlib
+import mmap
+import os
+import pickle
+import struct
+import sys
+import zlib
+from array import array
+from collections.abc import ItemsView, Mapping, MutableMapping, ValuesView
+from itertools import islice
+from operator import itemgetter, length_hint
 
-class HashTable:
+
+def _key_bytes(key):
+    """
+    Encode a key as bytes so it can be fed to a byte-oriented hash function.
+
+    Keys that compare equal must encode alike, or a table would hold them as
+    separate keys. str and bytes keys are encoded as themselves; numbers, None
+    and tuples of these get a tagged encoding in which every integral number
+    is written as an int, so that 1, 1.0 and True encode the same.
+
+    Raises:
+    - TypeError: If the key is, or contains, a value of any other type.
+    """
+    if isinstance(key, bytes):
+        return key
+    if isinstance(key, str):
+        return key.encode()
+    return _canonical_bytes(key)
+
+
+_FLOAT = struct.Struct("<d")
+_LENGTH = struct.Struct("<I")
+
+
+def _canonical_bytes(key):
+    """
+    The tagged encoding of a number, None, str, bytes or tuple key used by
+    _key_bytes.
+    """
+    if isinstance(key, float):
+        if not key.is_integer():
+            return b"f" + _FLOAT.pack(key)
+        key = int(key)
+    if isinstance(key, int):
+        return b"i" + key.to_bytes(key.bit_length() // 8 + 1, "little", signed=True)
+    if key is None:
+        return b"n"
+    if isinstance(key, str):
+        key = key.encode()
+        return b"s" + _LENGTH.pack(len(key)) + key
+    if isinstance(key, bytes):
+        return b"b" + _LENGTH.pack(len(key)) + key
+    if isinstance(key, tuple):
+        return b"t" + _LENGTH.pack(len(key)) + b"".join(map(_canonical_bytes, key))
+    raise TypeError(
+        f"a stable hash cannot encode keys of type {type(key).__name__!r}"
+    )
+
+
+def _crc32_hash(key):
+    """
+    Stable, non-cryptographic 32-bit hash (CRC-32) of the given key; see
+    _key_bytes for the keys it accepts.
+    """
+    return zlib.crc32(_key_bytes(key))
+
+
+def _sha256_hash(key):
+    """
+    Cryptographic 256-bit hash (SHA-256) of the given key; see _key_bytes for
+    the keys it accepts.
+    """
+    return int.from_bytes(hashlib.sha256(_key_bytes(key)).digest(), "big")
+
+
+# Hash strategies that can be selected by name. "builtin" uses Python's own
+# hash(), which is implemented in C and cached on str objects, so it is by far
+# the fastest. "crc32" is stable across processes and "sha256" is kept as an
+# opt-in for callers that need a cryptographic digest.
+HASH_FUNCTIONS = {
+    "builtin": hash,
+    "crc32": _crc32_hash,
+    "sha256": _sha256_hash,
+}
+
+
+def _resolve_hash_function(hash_function):
+    """
+    Turn a strategy name from HASH_FUNCTIONS into its callable. Callables are
+    returned unchanged.
+
+    Raises:
+    - ValueError: If hash_function is not a known strategy name.
+    """
+    if isinstance(hash_function, str):
+        if hash_function not in HASH_FUNCTIONS:
+            raise ValueError(f"Unknown hash function: {hash_function}")
+        return HASH_FUNCTIONS[hash_function]
+    return hash_function
+
+
+# Every empty bucket of a HashTable is this one immutable tuple, so a table of
+# any size is allocated with a single list multiplication and a bucket list is
+# only created once an entry lands in it.
+_EMPTY_BUCKET = ()
+
+
+def _add_entry(table, index, entry):
+    """
+    Append an entry to the bucket at table[index], creating the bucket list if
+    the slot still holds the shared empty bucket.
+    """
+    bucket = table[index]
+    if bucket:
+        bucket.append(entry)
+    else:
+        table[index] = [entry]
+
+
+# Number of pairs set_many reads from its input before growing the table.
+_BULK_CHUNK = 65536
+
+# Pick the key, value or (key, value) pair out of a (hash, key, value) entry.
+_KEY = itemgetter(1)
+_VALUE = itemgetter(2)
+_ITEM = itemgetter(1, 2)
+
+
+class HashTable(MutableMapping):
     """
     The Hash table data structure stores elements in key-value pairs where
         i. Key- unique integer that is used for indexing the values
@@ -15,9 +144,23 @@ class HashTable:
     We can resolve the hash collision using one of the following techniques.
         1.Collision resolution by chaining
         2.Open Addressing: Linear/Quadratic Probing and Double Hashing
+
+    HashTable uses chaining; OpenAddressingHashTable below uses open addressing.
+
+    Both are full MutableMappings, so they can stand in for a dict. keys(),
+    values() and items() return live views that read the table in place, and
+    iterating raises RuntimeError if the table changes size in the meantime.
     """
 
-    def __init__(self, size, load_factor) -> None:
+    def __init__(
+        self,
+        size,
+        load_factor,
+        hash_function="builtin",
+        min_load_factor=None,
+        incremental=False,
+        rehash_step=4,
+    ) -> None:
         """
         Initialize the HashTable object.
         
@@ -25,17 +168,81 @@ class HashTable:
         - size (int): The initial size of the hash table.
         - load_factor (float): The load factor threshold for resizing the hash
         table.
+        - hash_function (str or callable): The name of a strategy in
+        HASH_FUNCTIONS ("builtin", "crc32" or "sha256"), or a callable that
+        maps a key to an int. "crc32" and "sha256" only accept str, bytes,
+        number, None and tuple keys, and raise TypeError for any other key.
+        - min_load_factor (float): If given, the table halves its size (never
+        below the initial size) once deletes drop the load below this value.
+        - incremental (bool): If True, a resize only allocates the new table
+        and buckets are then migrated a few at a time by later inserts, deletes
+        and lookups, so no single insert pays for rehashing the whole table.
+        - rehash_step (int): The number of old buckets migrated per operation
+        while an incremental resize is in progress.
+
+        Raises:
+        - ValueError: If hash_function is not a known strategy name, or if
+        min_load_factor is so high that a shrink would immediately regrow.
         """
+        self.hash_function = _resolve_hash_function(hash_function)
+        self._check_min_load_factor(load_factor, min_load_factor)
         self.size = size
         self.load_factor = load_factor
-        self.threshold = int(self.load_factor * self.size)
+        self.min_load_factor = min_load_factor
+        self._set_thresholds()
         self.count = 0
-        self.table = [[] for i in range(self.size)]
+        self.table = [_EMPTY_BUCKET] * self.size
         self.original_size = size
+        self.incremental = incremental
+        self.rehash_step = rehash_step
+        self._reset_rehash()
+        # Bumped by every insert of a new key, delete, resize and clear, so
+        # that iterators can detect a concurrent change.
+        self._version = 0
+        # The number of iterators in progress. Lookups only migrate buckets
+        # while it is zero, since moving entries between the two tables would
+        # make an iterator skip or repeat them.
+        self._iterators = 0
+
+    def __len__(self):
+        """
+        Return the number of key-value pairs in the hash table.
+        """
+        return self.count
+
+    @staticmethod
+    def _check_min_load_factor(load_factor, min_load_factor):
+        """
+        Reject a min_load_factor at which halving the table would push it back
+        over load_factor.
+        """
+        if min_load_factor is not None and not 0 <= min_load_factor * 2 < load_factor:
+            raise ValueError("min_load_factor must be below half of load_factor")
+
+    def _set_thresholds(self):
+        """
+        Recompute the entry counts that trigger growing and shrinking for the
+        current size.
+        """
+        self.threshold = int(self.load_factor * self.size)
+        if self.min_load_factor is None:
+            self.min_threshold = -1
+        else:
+            self.min_threshold = int(self.min_load_factor * self.size)
+
+    def _shrink_size(self):
+        """
+        Return the size to shrink to after a delete, or None if the table should
+        keep its current size.
+        """
+        if self.count < self.min_threshold and self.size > self.original_size:
+            return max(self.size // 2, self.original_size)
+        return None
 
     def hash(self, key):
         """
-        Compute the hash value of the given key using SHA-256.
+        Compute the bucket index of the given key using the configured hash
+        function.
         
         Parameters:
         - key (str): The key to be hashed.
@@ -43,46 +250,124 @@ class HashTable:
         Returns:
         - int: The hash value of the key within the range of the hash table size.
         """
-        h = hashlib.sha256(key.encode())
-        return int(h.hexdigest(), 16) % self.size
+        return self.hash_function(key) % self.size
 
-    def _resize(self):
+    def _resize(self, new_size=None, eager=False):
         """
-        Resize the hash table by doubling its size and rehashing all existing key-value pairs.
+        Resize the hash table (by default doubling its size) and redistribute
+        all existing entries. Every entry carries its full hash, so no key is
+        hashed again.
+
+        In incremental mode the entries are not moved here: the current table
+        becomes the old table and _rehash_step migrates it over later
+        operations.
+
+        Parameters:
+        - new_size (int): The number of buckets to resize to.
+        - eager (bool): Move every entry now, even in incremental mode.
         """
-        new_size = self.size * 2
-        new_table = [[] for i in range(new_size)]
-        
-        for bucket in self.table:
-            for key, value in bucket:
-                new_index = self.hash(key) % new_size
-                new_table[new_index].append((key, value))
+        if new_size is None:
+            new_size = self.size * 2
+        if self.old_table is not None:
+            # A resize is due before the previous one finished; complete it so
+            # that there are never more than two tables.
+            self._rehash_step(self.old_size)
+        new_table = [_EMPTY_BUCKET] * new_size
+
+        if self.incremental and not eager:
+            self.old_table = self.table
+            self.old_size = self.size
+            self.rehash_index = 0
+        else:
+            for bucket in self.table:
+                for entry in bucket:
+                    _add_entry(new_table, entry[0] % new_size, entry)
                 
         self.size = new_size
-        self.threshold = int(new_size * self.load_factor)
+        self._set_thresholds()
         self.table = new_table
 
+    def _reset_rehash(self):
+        """
+        Forget any incremental resize in progress.
+        """
+        self.old_table = None
+        self.old_size = 0
+        self.rehash_index = 0
+
+    def _rehash_step(self, buckets):
+        """
+        Migrate up to the given number of buckets from the old table to the
+        current one, finishing the incremental resize when none are left.
+
+        Parameters:
+        - buckets (int): The number of old buckets to migrate.
+        """
+        old = self.old_table
+        table = self.table
+        size = self.size
+        stop = min(self.rehash_index + buckets, self.old_size)
+        for index in range(self.rehash_index, stop):
+            for entry in old[index]:
+                _add_entry(table, entry[0] % size, entry)
+            old[index] = _EMPTY_BUCKET
+        self.rehash_index = stop
+        if stop == self.old_size:
+            self._reset_rehash()
+
+    def finish_rehash(self):
+        """
+        Complete an incremental resize in progress, so that the old table is
+        released right away instead of over later operations. Iterators in
+        progress are invalidated.
+        """
+        if self.old_table is not None:
+            self._rehash_step(self.old_size)
+            self._version += 1
+
+    def _locate(self, h):
+        """
+        Return the table and bucket index that hold (or would hold) the key
+        with hash h.
+
+        While an incremental resize is in progress, a key lives in the old
+        table exactly when its old bucket has not been migrated yet, so only
+        one bucket ever has to be searched.
+        """
+        if self.old_table is not None:
+            index = h % self.old_size
+            if index >= self.rehash_index:
+                return self.old_table, index
+        return self.table, h % self.size
+
     def __setitem__(self, key, value):
         """
         Insert a key-value pair into the hash table.
 
+        Updating an existing key does not change the layout, so it is allowed
+        while iterating. An insert of a new key migrates a step of an
+        incremental resize, as do deletes and lookups.
+
         Parameters:
         - key (str): The key to insert.
         - value: The value associated with the key.
         """
-        index = self.hash(key)
-        bucket = self.table[index]
+        h = self.hash_function(key)
+        table, index = self._locate(h)
+        bucket = table[index]
         
-        for k, _ in bucket:
-            if k == key:
+        for idx, (eh, k, _) in enumerate(bucket):
+            if eh == h and k == key:
                 # Update the value if the key already exists
-                bucket[bucket.index((k, _))] = (key, value)
+                bucket[idx] = (h, key, value)
                 return
-        bucket.append((key, value))
-        if len(bucket) == 1:
-            self.count += 1
+        _add_entry(table, index, (h, key, value))
+        self.count += 1
+        self._version += 1
         if self.count > self.threshold:
             self._resize()
+        elif self.old_table is not None:
+            self._rehash_step(self.rehash_step)
 
     def __getitem__(self, key):
         """
@@ -97,14 +382,108 @@ class HashTable:
         Raises:
         - KeyError: If the key is not found in the hash table.
         """
-        index = self.hash(key)
-        bucket = self.table[index]
+        # A lookup migrates a step of an incremental resize, unless that would
+        # disturb an iterator, so that a read-only workload still completes it.
+        # _locate is inlined here because lookups are the hot path.
+        h = self.hash_function(key)
+        if self.old_table is not None and not self._iterators:
+            self._rehash_step(self.rehash_step)
+        if self.old_table is not None and h % self.old_size >= self.rehash_index:
+            bucket = self.old_table[h % self.old_size]
+        else:
+            bucket = self.table[h % self.size]
         
-        for idx, (k, _) in enumerate(bucket):
-            if k == key:
-                return bucket[idx]
+        for eh, k, v in bucket:
+            if eh == h and k == key:
+                return v
         raise KeyError(f"Key({key}) not found in the hash table")
 
+    def _find(self, key):
+        """
+        Return the (hash, key, value) entry for the given key, or None if the
+        key is not in the hash table.
+        """
+        h = self.hash_function(key)
+        if self.old_table is not None and not self._iterators:
+            self._rehash_step(self.rehash_step)
+        if self.old_table is not None and h % self.old_size >= self.rehash_index:
+            bucket = self.old_table[h % self.old_size]
+        else:
+            bucket = self.table[h % self.size]
+        for entry in bucket:
+            if entry[0] == h and entry[1] == key:
+                return entry
+        return None
+
+    def __contains__(self, key):
+        """
+        Check whether the given key is in the hash table without raising.
+
+        Parameters:
+        - key (str): The key to look for.
+
+        Returns:
+        - bool: True if the key is present, False otherwise.
+        """
+        return self._find(key) is not None
+
+    def get(self, key, default=None):
+        """
+        Retrieve the value for the given key, or default if it is missing.
+        Unlike __getitem__ a miss costs no exception.
+
+        Parameters:
+        - key (str): The key to retrieve the value for.
+        - default: The value to return if the key is missing.
+
+        Returns:
+        - value: The value associated with the key, or default.
+        """
+        entry = self._find(key)
+        return default if entry is None else entry[2]
+
+    def _entries(self):
+        """
+        Yield every (hash, key, value) entry in the hash table, checking after
+        each one that the table has not changed size.
+
+        Raises:
+        - RuntimeError: If an entry is inserted or deleted while iterating.
+        """
+        version = self._version
+        self._iterators += 1
+        try:
+            for table in (self.old_table, self.table):
+                if table is None:
+                    continue
+                for bucket in table:
+                    for entry in bucket:
+                        yield entry
+                        if self._version != version:
+                            raise RuntimeError(
+                                "HashTable changed size during iteration"
+                            )
+        finally:
+            self._iterators -= 1
+
+    def __iter__(self):
+        """
+        Return a lazy iterator over the keys of the hash table.
+        """
+        return map(_KEY, self._entries())
+
+    def values(self):
+        """
+        Return a live view of the values in the hash table.
+        """
+        return _HashTableValuesView(self)
+
+    def items(self):
+        """
+        Return a live view of the (key, value) pairs in the hash table.
+        """
+        return _HashTableItemsView(self)
+
     def __delitem__(self, key):
         """
         Delete the key-value pair with the given key from the hash table.
@@ -115,14 +494,20 @@ class HashTable:
         Raises:
         - KeyError: If the key is not found in the hash table.
         """
-        index = self.hash(key)
-        bucket = self.table[index]
+        h = self.hash_function(key)
+        table, index = self._locate(h)
+        bucket = table[index]
         
-        for idx, (k, _) in enumerate(bucket):
-            if k == key:
+        for idx, (eh, k, _) in enumerate(bucket):
+            if eh == h and k == key:
                 del bucket[idx]
-                if len(bucket) == 0:
-                    self.count -= 1
+                self.count -= 1
+                self._version += 1
+                new_size = self._shrink_size()
+                if new_size is not None:
+                    self._resize(new_size)
+                elif self.old_table is not None:
+                    self._rehash_step(self.rehash_step)
                 return
         raise KeyError(f"Key({key}) not found in the hash table")
 
@@ -131,18 +516,850 @@ class HashTable:
         Clear the hash table by resetting it to its original size and state.
         """
         self.size = self.original_size
-        self.threshold = int(self.size * self.load_factor)
-        self.table = [[] for i in range(self.size)]
+        self._set_thresholds()
+        self.table = [_EMPTY_BUCKET] * self.size
+        self.count = 0
+        self._reset_rehash()
+        self._version += 1
+
+    @classmethod
+    def from_items(cls, items, size=8, load_factor=0.75, **kwargs):
+        """
+        Build a hash table from an iterable of key-value pairs or a mapping.
+
+        Parameters:
+        - items: A mapping or an iterable of (key, value) pairs.
+        - size (int): The initial size, which clear() returns to.
+        - load_factor (float): The load factor threshold for resizing.
+        - kwargs: Any other HashTable option, such as hash_function.
+
+        Returns:
+        - HashTable: A new table holding the given pairs.
+        """
+        table = cls(size, load_factor, **kwargs)
+        table.update(items)
+        return table
+
+    def _size_for(self, n):
+        """
+        Return the size this table would have to double to before n entries fit
+        under its load factor.
+        """
+        size = self.size
+        while int(self.load_factor * size) < n:
+            size *= 2
+        return size
+
+    def reserve(self, n):
+        """
+        Grow the hash table once so that it can hold n entries without any
+        further resize. An incremental resize in progress is completed first.
+
+        Parameters:
+        - n (int): The number of entries to make room for.
+        """
+        self.finish_rehash()
+        new_size = self._size_for(n)
+        if new_size != self.size:
+            self._resize(new_size, eager=True)
+            self._version += 1
+
+    def set_many(self, items, pause_gc=False):
+        """
+        Insert many key-value pairs at once.
+
+        If the input reports its length the table is sized for it once up
+        front. The input is then consumed in chunks and the table is grown at
+        most once per chunk, so generators are never materialized in full.
+
+        Loading millions of entries triggers many cyclic garbage collections
+        that find nothing to free. pause_gc disables the collector for the
+        duration of the load to avoid them. The collector is process-wide, so
+        this also pauses collection for every other thread; only use it when
+        that is acceptable.
+
+        Parameters:
+        - items: An iterable of (key, value) pairs.
+        - pause_gc (bool): Disable the cyclic garbage collector, process-wide,
+        while loading.
+        """
+        expected = length_hint(items)
+        if expected:
+            self.reserve(self.count + expected)
+        items = iter(items)
+        gc_enabled = pause_gc and gc.isenabled()
+        if gc_enabled:
+            gc.disable()
+        try:
+            while True:
+                chunk = list(islice(items, _BULK_CHUNK))
+                if not chunk:
+                    return
+                self.reserve(self.count + len(chunk))
+                self._insert_chunk(chunk)
+        finally:
+            if gc_enabled:
+                gc.enable()
+
+    def _insert_chunk(self, chunk):
+        """
+        Insert a list of key-value pairs into a table that was already reserved
+        for them, so no load checks or resizes are needed along the way.
+        """
+        hash_function = self.hash_function
+        table = self.table
+        size = self.size
+        count = self.count
+        for key, value in chunk:
+            h = hash_function(key)
+            index = h % size
+            bucket = table[index]
+            for idx, (eh, k, _) in enumerate(bucket):
+                if eh == h and k == key:
+                    bucket[idx] = (h, key, value)
+                    break
+            else:
+                if bucket:
+                    bucket.append((h, key, value))
+                else:
+                    table[index] = [(h, key, value)]
+                count += 1
+        if count != self.count:
+            self._version += 1
+        self.count = count
+
+    def update(self, other=(), **kwargs):
+        """
+        Insert every pair from a mapping or an iterable of key-value pairs,
+        followed by any keyword arguments, like dict.update.
+
+        Parameters:
+        - other: A mapping or an iterable of (key, value) pairs.
+        """
+        if isinstance(other, Mapping):
+            other = other.items()
+        elif hasattr(other, "keys"):
+            other = ((key, other[key]) for key in other.keys())
+        self.set_many(other)
+        if kwargs:
+            self.set_many(kwargs.items())
+
+    def get_many(self, keys, default=None):
+        """
+        Look up many keys at once.
+
+        Parameters:
+        - keys: An iterable of keys.
+        - default: The value returned for keys that are not in the table.
+
+        Returns:
+        - list: The value of each key, in order, or default where missing.
+        """
+        if self.old_table is not None and not self._iterators:
+            self._rehash_step(self.rehash_step * max(1, length_hint(keys)))
+        hash_function = self.hash_function
+        table = self.table
+        size = self.size
+        old = self.old_table
+        old_size = self.old_size
+        rehash_index = self.rehash_index
+        result = []
+        append = result.append
+        for key in keys:
+            h = hash_function(key)
+            if old is not None and h % old_size >= rehash_index:
+                bucket = old[h % old_size]
+            else:
+                bucket = table[h % size]
+            for eh, k, v in bucket:
+                if eh == h and k == key:
+                    append(v)
+                    break
+            else:
+                append(default)
+        return result
+
+    def save(self, path):
+        """
+        Write the hash table to a snapshot file that HashTable.load can map
+        back into memory without deserializing it.
+
+        The file holds a header, a bucket index of offsets and a packed region
+        of entries grouped by bucket. Entries are placed with a hash that is
+        stable across processes: the table's own hashes are reused if it uses
+        "crc32" or "sha256", otherwise every key is hashed with "crc32". The
+        file is written next to path and moved into place once complete.
+
+        Parameters:
+        - path (str): The file to write.
+
+        Raises:
+        - TypeError: If a key is of a type the stable hashes cannot encode.
+        """
+        if self.hash_function in _SNAPSHOT_HASHES:
+            hash_function = self.hash_function
+            reuse = True
+        else:
+            hash_function = _crc32_hash
+            reuse = False
+        n_buckets = 1
+        while n_buckets < len(self):
+            n_buckets *= 2
+        mask = n_buckets - 1
+
+        buckets = [[] for i in range(n_buckets)]
+        for h, key, value in self._entries():
+            if not reuse:
+                h = hash_function(key)
+            h &= _HASH_MASK
+            buckets[h & mask].append((h, _encode(key), _encode(value)))
+
+        offsets = array("Q")
+        position = 0
+        for bucket in buckets:
+            offsets.append(position)
+            for _, key, value in bucket:
+                position += _SNAPSHOT_ENTRY.size + len(key) + len(value)
+        offsets.append(position)
+        if sys.byteorder == "big":
+            offsets.byteswap()
+
+        temp_path = f"{path}.tmp"
+        with open(temp_path, "wb") as file:
+            file.write(
+                _SNAPSHOT_HEADER.pack(
+                    _SNAPSHOT_MAGIC,
+                    _SNAPSHOT_VERSION,
+                    _SNAPSHOT_HASHES.index(hash_function),
+                    n_buckets,
+                    len(self),
+                )
+            )
+            file.write(offsets.tobytes())
+            for bucket in buckets:
+                for h, key, value in bucket:
+                    file.write(_SNAPSHOT_ENTRY.pack(h, len(key), len(value)))
+                    file.write(key)
+                    file.write(value)
+        os.replace(temp_path, path)
+
+    @classmethod
+    def load(cls, path, mmap=True, **kwargs):
+        """
+        Open a snapshot written by save.
+
+        With mmap=True the file is memory-mapped and served as a read-only
+        HashTableSnapshot, so opening it costs O(1) no matter how many entries
+        it holds and only the entries that are looked up are decoded. With
+        mmap=False every entry is read into a new, writable table.
+
+        Parameters:
+        - path (str): The snapshot file to open.
+        - mmap (bool): Whether to serve lookups straight from the mapped file.
+        - kwargs: Options for the new table when mmap is False, as for
+        from_items.
+
+        Returns:
+        - HashTableSnapshot or HashTable: The loaded table.
+        """
+        snapshot = HashTableSnapshot(path)
+        if mmap:
+            return snapshot
+        with snapshot:
+            return cls.from_items(snapshot.items(), **kwargs)
+
+
+# Slot markers for OpenAddressingHashTable. A tombstone (_DELETED) keeps probe
+# sequences that pass through a removed entry intact.
+_EMPTY = object()
+_DELETED = object()
+
+# Hashes are stored in an unsigned 64-bit array; the low bits are all that a
+# power-of-two table ever needs to pick a slot.
+_HASH_MASK = (1 << 64) - 1
+_MIN_SLOTS = 8
+
+
+class OpenAddressingHashTable(HashTable):
+    """
+    A hash table that resolves collisions by open addressing.
+
+    Keys, values and hashes live in three flat parallel arrays (slot_keys,
+    slot_values and slot_hashes) instead of a Python list of tuples per bucket,
+    which removes most of the per-entry memory and pointer chasing. The number
+    of slots is always a power of two, so a slot index is a bit mask of the
+    hash. Deleted slots are marked with a tombstone and reclaimed on resize.
+
+    Probing strategies:
+        1.linear: step to the next slot.
+        2.quadratic: step by 1, 2, 3, ... (triangular numbers), which visits
+        every slot of a power-of-two table.
+        3.double: step by an odd stride taken from the high bits of the hash.
+    """
+
+    PROBING = ("linear", "quadratic", "double")
+
+    def __init__(
+        self,
+        size,
+        load_factor,
+        hash_function="builtin",
+        probing="linear",
+        min_load_factor=None,
+    ) -> None:
+        """
+        Initialize the OpenAddressingHashTable object.
+
+        Parameters:
+        - size (int): The initial number of slots, rounded up to a power of two.
+        - load_factor (float): The fraction of slots (live entries plus
+        tombstones) that may be used before the table grows. Must be below 1.
+        - hash_function (str or callable): See HashTable.
+        - probing (str): One of "linear", "quadratic" or "double".
+        - min_load_factor (float): See HashTable.
+
+        Raises:
+        - ValueError: If load_factor, min_load_factor or probing is invalid.
+        """
+        if not 0 < load_factor < 1:
+            raise ValueError("load_factor must be between 0 and 1")
+        if probing not in self.PROBING:
+            raise ValueError(f"Unknown probing strategy: {probing}")
+        self._check_min_load_factor(load_factor, min_load_factor)
+        self.hash_function = _resolve_hash_function(hash_function)
+        self.probing = probing
+        self.load_factor = load_factor
+        self.min_load_factor = min_load_factor
+        self._version = 0
+        self.size = self._capacity_for(size)
+        self.original_size = self.size
+        self._allocate(self.size)
+
+    @staticmethod
+    def _capacity_for(size):
+        """
+        Round size up to the next power of two, with a small lower bound.
+        """
+        capacity = _MIN_SLOTS
+        while capacity < size:
+            capacity *= 2
+        return capacity
+
+    def _allocate(self, size):
+        """
+        Replace the slot arrays with empty arrays of the given size.
+        """
+        self.slot_keys = [_EMPTY] * size
+        self.slot_values = [None] * size
+        self.slot_hashes = array("Q", bytes(8 * size))
+        self.size = size
+        self._set_thresholds()
         self.count = 0
+        self.used = 0
+
+    def hash(self, key):
+        """
+        Compute the home slot of the given key.
+
+        Parameters:
+        - key (str): The key to be hashed.
+
+        Returns:
+        - int: The index of the first slot probed for the key.
+        """
+        return self.hash_function(key) & (self.size - 1)
+
+    def _probe(self, h, key):
+        """
+        Walk the probe sequence of a key.
+
+        Parameters:
+        - h (int): The 64-bit hash of the key.
+        - key: The key to look for.
+
+        Returns:
+        - tuple: (found, slot) where found is the slot holding the key or -1,
+        and slot is where the key should be inserted if it is missing (the
+        first tombstone on the way, otherwise the empty slot that ended the
+        probe).
+        """
+        keys = self.slot_keys
+        hashes = self.slot_hashes
+        mask = self.size - 1
+        index = h & mask
+        step = (h >> 16) | 1 if self.probing == "double" else 1
+        quadratic = self.probing == "quadratic"
+        free = -1
+        while True:
+            k = keys[index]
+            if k is _EMPTY:
+                return -1, index if free < 0 else free
+            if k is _DELETED:
+                if free < 0:
+                    free = index
+            elif hashes[index] == h and (k is key or k == key):
+                return index, index
+            index = (index + step) & mask
+            if quadratic:
+                step += 1
+
+    def _resize(self, new_size=None):
+        """
+        Rebuild the slot arrays. By default they double unless most of the used
+        slots are tombstones, in which case they are only purged. Entries are
+        placed using their stored hashes, so no key is hashed or compared again.
+
+        Parameters:
+        - new_size (int): The number of slots to rebuild with (a power of two).
+        """
+        old_keys = self.slot_keys
+        old_values = self.slot_values
+        old_hashes = self.slot_hashes
+        if new_size is None:
+            new_size = self.size * 2 if self.count * 2 > self.threshold else self.size
+        self._allocate(new_size)
+
+        keys = self.slot_keys
+        values = self.slot_values
+        hashes = self.slot_hashes
+        mask = new_size - 1
+        double = self.probing == "double"
+        quadratic = self.probing == "quadratic"
+        count = 0
+        for k, v, h in zip(old_keys, old_values, old_hashes):
+            if k is _EMPTY or k is _DELETED:
+                continue
+            index = h & mask
+            step = (h >> 16) | 1 if double else 1
+            while keys[index] is not _EMPTY:
+                index = (index + step) & mask
+                if quadratic:
+                    step += 1
+            keys[index] = k
+            values[index] = v
+            hashes[index] = h
+            count += 1
+        self.count = self.used = count
+
+    def finish_rehash(self):
+        """
+        Do nothing: open addressing resizes all at once, so there is never a
+        resize in progress to finish.
+        """
+
+    def __setitem__(self, key, value):
+        """
+        Insert a key-value pair into the hash table.
+
+        Parameters:
+        - key (str): The key to insert.
+        - value: The value associated with the key.
+        """
+        h = self.hash_function(key) & _HASH_MASK
+        found, slot = self._probe(h, key)
+        if found >= 0:
+            self.slot_values[found] = value
+            return
+        if self.slot_keys[slot] is _EMPTY:
+            self.used += 1
+        self.slot_keys[slot] = key
+        self.slot_values[slot] = value
+        self.slot_hashes[slot] = h
+        self.count += 1
+        self._version += 1
+        if self.used > self.threshold:
+            self._resize()
+
+    def __getitem__(self, key):
+        """
+        Retrieve the value associated with the given key from the hash table.
+
+        Parameters:
+        - key (str): The key to retrieve the value for.
+
+        Returns:
+        - value: The value associated with the key.
+
+        Raises:
+        - KeyError: If the key is not found in the hash table.
+        """
+        # The probe loop is inlined here because lookups are the hot path.
+        h = self.hash_function(key) & _HASH_MASK
+        keys = self.slot_keys
+        mask = self.size - 1
+        index = h & mask
+        step = (h >> 16) | 1 if self.probing == "double" else 1
+        quadratic = self.probing == "quadratic"
+        while True:
+            k = keys[index]
+            if k is key or (
+                k is not _DELETED and k is not _EMPTY
+                and k == key and self.slot_hashes[index] == h
+            ):
+                return self.slot_values[index]
+            if k is _EMPTY:
+                raise KeyError(f"Key({key}) not found in the hash table")
+            index = (index + step) & mask
+            if quadratic:
+                step += 1
+
+    def __delitem__(self, key):
+        """
+        Delete the key-value pair with the given key from the hash table by
+        replacing it with a tombstone.
+
+        Parameters:
+        - key (str): The key to delete.
+
+        Raises:
+        - KeyError: If the key is not found in the hash table.
+        """
+        found, _ = self._probe(self.hash_function(key) & _HASH_MASK, key)
+        if found < 0:
+            raise KeyError(f"Key({key}) not found in the hash table")
+        self.slot_keys[found] = _DELETED
+        self.slot_values[found] = None
+        self.count -= 1
+        self._version += 1
+        new_size = self._shrink_size()
+        if new_size is not None:
+            self._resize(new_size)
+
+    def clear(self):
+        """
+        Clear the hash table by resetting it to its original size and state.
+        """
+        self._allocate(self.original_size)
+        self._version += 1
+
+    def reserve(self, n):
+        """
+        Grow the slot arrays once so that they can hold n entries without any
+        further resize. The arrays are also rebuilt, purging tombstones, if the
+        tombstones would otherwise eat into the room for n entries.
+
+        Parameters:
+        - n (int): The number of entries to make room for.
+        """
+        new_size = self._size_for(n)
+        tombstones = self.used - self.count
+        if new_size != self.size or n + tombstones > self.threshold:
+            self._resize(new_size)
+            self._version += 1
+
+    def _insert_chunk(self, chunk):
+        """
+        Insert a list of key-value pairs into a table that was already reserved
+        for them.
+        """
+        hash_function = self.hash_function
+        probe = self._probe
+        keys = self.slot_keys
+        values = self.slot_values
+        hashes = self.slot_hashes
+        for key, value in chunk:
+            h = hash_function(key) & _HASH_MASK
+            found, slot = probe(h, key)
+            if found >= 0:
+                values[found] = value
+                continue
+            if keys[slot] is _EMPTY:
+                self.used += 1
+            keys[slot] = key
+            values[slot] = value
+            hashes[slot] = h
+            self.count += 1
+            self._version += 1
+
+    def _find(self, key):
+        """
+        Return the (hash, key, value) entry for the given key, or None if the
+        key is not in the hash table.
+        """
+        h = self.hash_function(key) & _HASH_MASK
+        found, _ = self._probe(h, key)
+        if found < 0:
+            return None
+        return (h, self.slot_keys[found], self.slot_values[found])
+
+    def _entries(self):
+        """
+        Yield every (hash, key, value) entry in the hash table, checking after
+        each one that the table has not changed size.
+
+        Raises:
+        - RuntimeError: If an entry is inserted or deleted while iterating.
+        """
+        version = self._version
+        keys = self.slot_keys
+        values = self.slot_values
+        hashes = self.slot_hashes
+        for index, k in enumerate(keys):
+            if k is _EMPTY or k is _DELETED:
+                continue
+            yield (hashes[index], k, values[index])
+            if self._version != version:
+                raise RuntimeError("HashTable changed size during iteration")
+
+    def get_many(self, keys, default=None):
+        """
+        Look up many keys at once.
+
+        Parameters:
+        - keys: An iterable of keys.
+        - default: The value returned for keys that are not in the table.
+
+        Returns:
+        - list: The value of each key, in order, or default where missing.
+        """
+        hash_function = self.hash_function
+        probe = self._probe
+        values = self.slot_values
+        result = []
+        append = result.append
+        for key in keys:
+            found, _ = probe(hash_function(key) & _HASH_MASK, key)
+            append(values[found] if found >= 0 else default)
+        return result
+
+
+class _HashTableValuesView(ValuesView):
+    """
+    A live view of the values of a hash table. Iterating reads the entries in
+    place instead of looking every key up again.
+    """
+
+    __slots__ = ()
+
+    def __iter__(self):
+        return map(_VALUE, self._mapping._entries())
+
+
+class _HashTableItemsView(ItemsView):
+    """
+    A live view of the (key, value) pairs of a hash table. Iterating reads the
+    entries in place instead of looking every key up again.
+    """
+
+    __slots__ = ()
+
+    def __iter__(self):
+        return map(_ITEM, self._mapping._entries())
+
+
+# Snapshot file layout (little-endian):
+#   header:       magic, format version, hash id, bucket count, entry count
+#   bucket index: bucket count + 1 offsets into the entry region
+#   entries:      64-bit hash, key length, value length, key bytes, value bytes
+_SNAPSHOT_MAGIC = b"DSAHTBL\x00"
+_SNAPSHOT_VERSION = 1
+_SNAPSHOT_HEADER = struct.Struct("<8sIIQQ")
+_SNAPSHOT_BOUNDS = struct.Struct("<QQ")
+_SNAPSHOT_ENTRY = struct.Struct("<QII")
+# Only hashes that are stable across processes can place entries on disk. The
+# position in this tuple is the hash id stored in the header.
+_SNAPSHOT_HASHES = (_crc32_hash, _sha256_hash)
+
+
+def _encode(obj):
+    """
+    Encode a key or value for a snapshot. Strings and bytes are stored raw
+    behind a one-byte tag so they can be compared without decoding; anything
+    else is pickled.
+    """
+    if isinstance(obj, str):
+        return b"s" + obj.encode()
+    if isinstance(obj, bytes):
+        return b"b" + obj
+    return b"p" + pickle.dumps(obj, pickle.HIGHEST_PROTOCOL)
+
+
+def _decode(data):
+    """
+    Decode a key or value encoded by _encode.
+    """
+    tag = data[:1]
+    if tag == b"s":
+        return data[1:].decode()
+    if tag == b"b":
+        return data[1:]
+    return pickle.loads(data[1:])
+
+
+class HashTableSnapshot(Mapping):
+    """
+    A read-only hash table served straight from a memory-mapped snapshot file
+    written by HashTable.save.
+
+    Opening a snapshot only reads its header; the operating system pages the
+    rest of the file in as lookups touch it. A lookup hashes the key, reads the
+    two offsets of its bucket from the index and scans the few entries of that
+    bucket, comparing the stored hash and then the key.
+
+    String and bytes keys are compared as raw bytes; any other stored key is
+    unpickled and compared with ==, so 1, 1.0 and True find the same entry,
+    just as they do in a HashTable.
+    """
+
+    def __init__(self, path) -> None:
+        """
+        Map the given snapshot file.
+
+        Parameters:
+        - path (str): The snapshot file to open.
+
+        Raises:
+        - ValueError: If the file is not a snapshot this version can read.
+        """
+        with open(path, "rb") as file:
+            self.map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magic, version, hash_id, n_buckets, count = _SNAPSHOT_HEADER.unpack_from(
+                self.map, 0
+            )
+        except struct.error:
+            magic = version = None
+        if magic != _SNAPSHOT_MAGIC or version != _SNAPSHOT_VERSION:
+            self.map.close()
+            raise ValueError(f"{path} is not a version {_SNAPSHOT_VERSION} snapshot")
+        self.hash_function = _SNAPSHOT_HASHES[hash_id]
+        self.n_buckets = n_buckets
+        self.count = count
+        self.index_start = _SNAPSHOT_HEADER.size
+        self.data_start = self.index_start + 8 * (n_buckets + 1)
+
+    def _locate(self, key):
+        """
+        Return the file position of the entry for the given key, or -1 if the
+        key is not in the snapshot.
+        """
+        data = self.map
+        h = self.hash_function(key) & _HASH_MASK
+        start, end = _SNAPSHOT_BOUNDS.unpack_from(
+            data, self.index_start + 8 * (h & (self.n_buckets - 1))
+        )
+        position = self.data_start + start
+        end += self.data_start
+        raw = _encode(key) if isinstance(key, (str, bytes)) else None
+        while position < end:
+            eh, key_length, value_length = _SNAPSHOT_ENTRY.unpack_from(data, position)
+            key_start = position + _SNAPSHOT_ENTRY.size
+            if eh == h:
+                stored = data[key_start : key_start + key_length]
+                if raw is None or stored[:1] == b"p":
+                    if _decode(stored) == key:
+                        return position
+                elif stored == raw:
+                    return position
+            position = key_start + key_length + value_length
+        return -1
+
+    def _value_at(self, position):
+        """
+        Decode the value of the entry at the given file position.
+        """
+        _, key_length, value_length = _SNAPSHOT_ENTRY.unpack_from(self.map, position)
+        start = position + _SNAPSHOT_ENTRY.size + key_length
+        return _decode(self.map[start : start + value_length])
+
+    def __getitem__(self, key):
+        """
+        Retrieve the value associated with the given key.
+
+        Raises:
+        - KeyError: If the key is not found in the snapshot.
+        """
+        position = self._locate(key)
+        if position < 0:
+            raise KeyError(f"Key({key}) not found in the hash table")
+        return self._value_at(position)
+
+    def __contains__(self, key):
+        return self._locate(key) >= 0
+
+    def get(self, key, default=None):
+        position = self._locate(key)
+        return default if position < 0 else self._value_at(position)
+
+    def __len__(self):
+        return self.count
+
+    def _entries(self):
+        """
+        Yield every (hash, key, value) entry by walking the entry region once.
+        """
+        data = self.map
+        position = self.data_start
+        end = len(data)
+        while position < end:
+            h, key_length, value_length = _SNAPSHOT_ENTRY.unpack_from(data, position)
+            key_start = position + _SNAPSHOT_ENTRY.size
+            value_start = key_start + key_length
+            position = value_start + value_length
+            yield (
+                h,
+                _decode(data[key_start:value_start]),
+                _decode(data[value_start:position]),
+            )
+
+    def __iter__(self):
+        return map(_KEY, self._entries())
+
+    def values(self):
+        return _HashTableValuesView(self)
+
+    def items(self):
+        return _HashTableItemsView(self)
+
+    def close(self):
+        """
+        Unmap the snapshot file.
+        """
+        self.map.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+if __name__ == "__main__":
+    table = HashTable(10, 0.75)
+    table["apple"] = 2
+    table["Apple"] = 3
+    table["watch"] = 1
+    table["apple"] = 4
+    print(table["apple"], len(table), "Apple" in table, table.get("pear"))
+    print(list(table.items()))
+    del table["apple"]
+    # del table["Apple"]
+    table.clear()
+    print(table.table)
+
+    secure = HashTable(10, 0.75, hash_function="sha256")
+    secure["apple"] = 2
+    print(secure["apple"])
+
+    smooth = HashTable(4, 0.75, incremental=True)
+    for i in range(10):
+        smooth[f"key{i}"] = i
+    print(smooth["key3"], smooth.old_table is not None)
+
+    bulk = HashTable.from_items((f"key{i}", i) for i in range(1000))
+    bulk.update({"key1": -1}, extra=0)
+    print(bulk.get_many(["key1", "extra", "missing"]), bulk.size)
+
+    import tempfile
 
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "bulk.snapshot")
+        bulk.save(path)
+        with HashTable.load(path) as snapshot:
+            print(snapshot["key42"], len(snapshot), "missing" in snapshot)
 
-hash = HashTable(10, 0.75)
-hash["apple"] = 2
-hash["Apple"] = 3
-hash["watch"] = 1
-hash["apple"] = 4
-print(hash["apple"])
-del hash["apple"]
-# del hash["Apple"]
-hash.clear()
-print(hash.table)
+    flat = OpenAddressingHashTable(8, 0.75, probing="quadratic")
+    flat["apple"] = 2
+    flat["Apple"] = 3
+    del flat["apple"]
+    print(flat["Apple"])
@@ -0,0 +1,66 @@
+# Benchmark: chained HashTable vs OpenAddressingHashTable
+
+import sys
+import time
+import tracemalloc
+
+from hash_table import HashTable, OpenAddressingHashTable
+
+
+def build(factory, keys):
+    """
+    Build a table from the given keys and measure the memory it holds.
+
+    Parameters:
+    - factory (callable): Returns a new, empty table.
+    - keys (list): The keys to insert; each key maps to its position.
+
+    Returns:
+    - tuple: (table, bytes allocated by the table)
+    """
+    tracemalloc.start()
+    table = factory()
+    for i, key in enumerate(keys):
+        table[key] = i
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return table, allocated
+
+
+def lookup_latency(table, keys, rounds=3):
+    """
+    Return the best average time in nanoseconds to look up one key.
+    """
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for key in keys:
+            table[key]
+        best = min(best, time.perf_counter() - start)
+    return best / len(keys) * 1e9
+
+
+def main(n=200_000):
+    """
+    Compare memory and lookup latency of the two layouts. Every table is
+    pre-sized to hold all n keys, so the numbers reflect the layout rather
+    than the resize policy.
+    """
+    keys = [f"key-{i}" for i in range(n)]
+    size = int(n / 0.75) + 1
+    candidates = [
+        ("chaining", lambda: HashTable(size, 0.75)),
+        ("open/linear", lambda: OpenAddressingHashTable(size, 0.75)),
+        ("open/quadratic", lambda: OpenAddressingHashTable(size, 0.75, probing="quadratic")),
+        ("open/double", lambda: OpenAddressingHashTable(size, 0.75, probing="double")),
+    ]
+    print(f"{n} string keys")
+    print(f"{'layout':<16}{'bytes/entry':>12}{'lookup ns':>12}")
+    for name, factory in candidates:
+        table, allocated = build(factory, keys)
+        latency = lookup_latency(table, keys)
+        print(f"{name:<16}{allocated / n:>12.1f}{latency:>12.1f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
@@ -1,12 +1,20 @@
+import functools
+from array import array
+
+
 class Node:
     """
     A class representing a node in a linked list.
 
+    Nodes declare __slots__, so they carry no per-instance __dict__.
+
     Attributes:
         data: The data stored in the node.
         next: A reference to the next node in the linked list.
     """
 
+    __slots__ = ("data", "next")
+
     def __init__(self, data) -> None:
         self.data = data
         self.next = None
@@ -22,13 +30,70 @@ class LinkedList:
         size: The number of nodes in the linked list.
     """
 
-    def __init__(self) -> None:
+    # Methods that change the list; in debug mode each is followed by a call
+    # to checkInvariants.
+    MUTATORS = (
+        "prepend",
+        "append",
+        "removeFirst",
+        "removeLast",
+        "insertAt",
+        "removeAt",
+        "extend",
+        "concat",
+    )
+
+    def __init__(self, debug=False) -> None:
         """
         Initializes a new instance of the LinkedList class.
+
+        Args:
+            debug: If True, every change to the list is followed by a full
+                invariant check, which makes corruption fail fast at O(n) cost
+                per change. Leave it off in production.
         """
         self.header = None
         self.tail = None
         self.size = 0
+        self.debug = debug
+        if debug:
+            for name in self.MUTATORS:
+                setattr(self, name, self._checked(getattr(self, name)))
+
+    def _checked(self, method):
+        """
+        Wraps a bound method so that the invariants are checked after it runs.
+        """
+
+        @functools.wraps(method)
+        def checked(*args, **kwargs):
+            result = method(*args, **kwargs)
+            self.checkInvariants()
+            return result
+
+        return checked
+
+    def checkInvariants(self):
+        """
+        Verifies the structure of the linked list: size matches the number of
+        nodes, and tail is the last node.
+
+        Raises:
+            AssertionError: If an invariant does not hold.
+        """
+        count = 0
+        last = None
+        current = self.header
+        while current is not None:
+            count += 1
+            if count > self.size:
+                raise AssertionError(f"more nodes than size {self.size} (or a cycle)")
+            last = current
+            current = current.next
+        if count != self.size:
+            raise AssertionError(f"counted {count} nodes but size is {self.size}")
+        if last is not self.tail:
+            raise AssertionError("tail is not the last node")
 
     def prepend(self, data):
         """
@@ -69,12 +134,96 @@ class LinkedList:
         Returns:
             A string containing the data of each node in the linked list, separated by commas.
         """
-        data = ""
+        return "".join(str(data) + "," for data in self)
+
+    def __len__(self):
+        """
+        Returns the number of nodes in the linked list.
+        """
+        return self.size
+
+    def __iter__(self):
+        """
+        Lazily yields the data of each node, from header to tail.
+        """
         current = self.header
-        while current != None:
-            data = data + str(current.data) + ","
+        while current is not None:
+            yield current.data
             current = current.next
-        return data
+
+    def __reversed__(self):
+        """
+        Yields the data of each node, from tail to header.
+
+        A singly linked list cannot walk backwards, so this first collects a
+        reference to every datum; DoublyLinkedList walks its prev links lazily.
+        """
+        return reversed(list(self))
+
+    def extend(self, iterable):
+        """
+        Appends every item of an iterable, consuming it lazily so that a
+        generator is never materialized.
+
+        The new nodes are chained up on their own and only spliced onto the
+        tail once the iterable is exhausted, so an iterable that raises leaves
+        the list unchanged, and extending a list with itself copies it once.
+
+        Args:
+            iterable: The items to append.
+        """
+        first = last = None
+        count = 0
+        for data in iterable:
+            n = Node(data)
+            if last is None:
+                first = n
+            else:
+                last.next = n
+            last = n
+            count += 1
+        if first is None:
+            return
+        if self.tail is None:
+            self.header = first
+        else:
+            self.tail.next = first
+        self.tail = last
+        self.size += count
+
+    def concat(self, other):
+        """
+        Moves every node of another linked list onto the end of this one in
+        O(1) by linking this tail to the other header. The other list is left
+        empty.
+
+        Args:
+            other: A linked list of the same class.
+
+        Raises:
+            TypeError: If other is a different kind of linked list.
+            ValueError: If other is this linked list.
+        """
+        if type(other) is not type(self):
+            raise TypeError(f"cannot concat {type(other).__name__} to {type(self).__name__}")
+        if other is self:
+            raise ValueError("cannot concat a linked list to itself")
+        if other.size == 0:
+            return
+        if self.size == 0:
+            self.header = other.header
+        else:
+            self._link(self.tail, other.header)
+        self.tail = other.tail
+        self.size += other.size
+        other.header = other.tail = None
+        other.size = 0
+
+    def _link(self, n, following):
+        """
+        Makes following the successor of node n.
+        """
+        n.next = following
 
     def removeFirst(self):
         """
@@ -130,6 +279,7 @@ class LinkedList:
         if pos < 0 or pos > self.size:
             return None
         elif pos == 0:
+            # prepend and append keep size up to date themselves.
             self.prepend(data)
         elif pos == self.size:
             self.append(data)
@@ -144,7 +294,8 @@ class LinkedList:
                 counter += 1
             n.next = current
             prev.next = n
-        self.size += 1
+            self.size += 1
+        return data
 
     def removeAt(self, pos):
         """
@@ -175,15 +326,668 @@ class LinkedList:
             return current.data
 
 
+class DoublyNode(Node):
+    """
+    A class representing a node in a doubly linked list.
+
+    Attributes:
+        data: The data stored in the node.
+        next: A reference to the next node in the linked list.
+        prev: A reference to the previous node in the linked list.
+    """
+
+    __slots__ = ("prev",)
+
+    def __init__(self, data) -> None:
+        super().__init__(data)
+        self.prev = None
+
+
+class DoublyLinkedList(LinkedList):
+    """
+    A class representing a doubly linked list.
+
+    Every node also points back to its predecessor, so a node can be unlinked
+    in O(1) given only a reference to it, removeLast no longer has to walk the
+    list to find the node before tail, and positional operations walk from
+    whichever end is closer. A Cursor can insert and remove at its position
+    during a scan without walking the list again.
+
+    Attributes:
+        header: A reference to the first node in the linked list.
+        tail: A reference to the last node in the linked list.
+        size: The number of nodes in the linked list.
+    """
+
+    MUTATORS = LinkedList.MUTATORS + (
+        "prependNode",
+        "appendNode",
+        "removeNode",
+        "insertBefore",
+        "insertAfter",
+    )
+
+    def checkInvariants(self):
+        """
+        Verifies the structure of the linked list: size matches the number of
+        nodes, tail is the last node, and every prev link mirrors a next link.
+
+        Raises:
+            AssertionError: If an invariant does not hold.
+        """
+        super().checkInvariants()
+        previous = None
+        current = self.header
+        while current is not None:
+            if current.prev is not previous:
+                raise AssertionError(f"prev link of node {current.data} is broken")
+            previous = current
+            current = current.next
+
+    def __reversed__(self):
+        """
+        Lazily yields the data of each node, from tail to header.
+        """
+        current = self.tail
+        while current is not None:
+            yield current.data
+            current = current.prev
+
+    def extend(self, iterable):
+        """
+        Appends every item of an iterable, consuming it lazily so that a
+        generator is never materialized.
+
+        The new nodes are chained up on their own and only spliced onto the
+        tail once the iterable is exhausted, so an iterable that raises leaves
+        the list unchanged, and extending a list with itself copies it once.
+
+        Args:
+            iterable: The items to append.
+        """
+        first = last = None
+        count = 0
+        for data in iterable:
+            n = DoublyNode(data)
+            if last is None:
+                first = n
+            else:
+                self._link(last, n)
+            last = n
+            count += 1
+        if first is None:
+            return
+        if self.tail is None:
+            self.header = first
+        else:
+            self._link(self.tail, first)
+        self.tail = last
+        self.size += count
+
+    def _link(self, n, following):
+        """
+        Makes following the successor of node n, in both directions.
+        """
+        n.next = following
+        following.prev = n
+
+    def prependNode(self, n):
+        """
+        Links an existing, detached node in at the beginning of the linked list.
+
+        Args:
+            n: The DoublyNode to link in.
+
+        Returns:
+            The linked node.
+        """
+        n.prev = None
+        n.next = self.header
+        if self.size == 0:
+            self.tail = n
+        else:
+            self.header.prev = n
+        self.header = n
+        self.size += 1
+        return n
+
+    def appendNode(self, n):
+        """
+        Links an existing, detached node in at the end of the linked list.
+
+        Args:
+            n: The DoublyNode to link in.
+
+        Returns:
+            The linked node.
+        """
+        n.next = None
+        n.prev = self.tail
+        if self.size == 0:
+            self.header = n
+        else:
+            self.tail.next = n
+        self.tail = n
+        self.size += 1
+        return n
+
+    def removeNode(self, n):
+        """
+        Unlinks the given node from the linked list in O(1).
+
+        Args:
+            n: A DoublyNode that belongs to this linked list.
+
+        Returns:
+            The data of the removed node.
+        """
+        if n.prev is None:
+            self.header = n.next
+        else:
+            n.prev.next = n.next
+        if n.next is None:
+            self.tail = n.prev
+        else:
+            n.next.prev = n.prev
+        n.prev = n.next = None
+        self.size -= 1
+        return n.data
+
+    def prepend(self, data):
+        """
+        Inserts a new node with the given data at the beginning of the linked list.
+
+        Args:
+            data: The data to be stored in the new node.
+        """
+        self.prependNode(DoublyNode(data))
+
+    def append(self, data):
+        """
+        Inserts a new node with the given data at the end of the linked list.
+
+        Args:
+            data: The data to be stored in the new node.
+        """
+        self.appendNode(DoublyNode(data))
+
+    def removeFirst(self):
+        """
+        Removes and returns the data of the first node in the linked list.
+
+        Returns:
+            The data of the first node, or None if the list is empty.
+        """
+        if self.size == 0:
+            return None
+        return self.removeNode(self.header)
+
+    def removeLast(self):
+        """
+        Removes and returns the data of the last node in the linked list in O(1).
+
+        Returns:
+            The data of the last node, or None if the list is empty.
+        """
+        if self.size == 0:
+            return None
+        return self.removeNode(self.tail)
+
+    def nodeAt(self, pos):
+        """
+        Returns the node at the specified position in the linked list, walking
+        from whichever end is closer.
+
+        Args:
+            pos: The position of the node, which must be valid.
+
+        Returns:
+            The node at that position.
+        """
+        if pos <= self.size // 2:
+            current = self.header
+            for _ in range(pos):
+                current = current.next
+        else:
+            current = self.tail
+            for _ in range(self.size - 1 - pos):
+                current = current.prev
+        return current
+
+    def insertBefore(self, n, data):
+        """
+        Inserts a new node with the given data right before the given node.
+
+        Args:
+            n: A DoublyNode that belongs to this linked list.
+            data: The data to be stored in the new node.
+
+        Returns:
+            The new node.
+        """
+        new = DoublyNode(data)
+        new.next = n
+        new.prev = n.prev
+        if n.prev is None:
+            self.header = new
+        else:
+            n.prev.next = new
+        n.prev = new
+        self.size += 1
+        return new
+
+    def insertAfter(self, n, data):
+        """
+        Inserts a new node with the given data right after the given node.
+
+        Args:
+            n: A DoublyNode that belongs to this linked list.
+            data: The data to be stored in the new node.
+
+        Returns:
+            The new node.
+        """
+        if n.next is None:
+            return self.appendNode(DoublyNode(data))
+        return self.insertBefore(n.next, data)
+
+    def cursor(self, pos=0):
+        """
+        Returns a cursor positioned at the specified position.
+
+        Args:
+            pos: The starting position, from 0 up to size (just past the end).
+
+        Returns:
+            A Cursor over this linked list.
+
+        Raises:
+            IndexError: If the position is out of range.
+        """
+        if pos < 0 or pos > self.size:
+            raise IndexError("cursor position out of range")
+        return Cursor(self, None if pos == self.size else self.nodeAt(pos), pos)
+
+    def insertAt(self, pos, data):
+        """
+        Inserts a new node with the given data at the specified position in the linked list.
+
+        Args:
+            pos: The position at which to insert the new node.
+            data: The data to be stored in the new node.
+
+        Returns:
+            None if the position is invalid, otherwise returns the data of the inserted node.
+        """
+        if pos < 0 or pos > self.size:
+            return None
+        if pos == self.size:
+            self.append(data)
+        else:
+            self.insertBefore(self.nodeAt(pos), data)
+        return data
+
+    def removeAt(self, pos):
+        """
+        Removes and returns the data of the node at the specified position in the linked list.
+
+        Args:
+            pos: The position of the node to remove.
+
+        Returns:
+            The data of the removed node, or None if the position is invalid.
+        """
+        if pos < 0 or pos >= self.size:
+            return None
+        return self.removeNode(self.nodeAt(pos))
+
+
+class Cursor:
+    """
+    A class representing a position in a doubly linked list.
+
+    A cursor sits on a node, or just past the end of the list when node is
+    None. Inserting and removing through the cursor splices the list at its
+    position in O(1), so a single scan can edit the list as it goes.
+
+    Attributes:
+        linked_list: The DoublyLinkedList the cursor moves over.
+        node: The node under the cursor, or None past the end.
+        index: The position of the cursor.
+    """
+
+    def __init__(self, linked_list, node, index) -> None:
+        self.linked_list = linked_list
+        self.node = node
+        self.index = index
+
+    def isDone(self):
+        """
+        Checks whether the cursor is past the end of the list.
+
+        Returns:
+            True if there is no node under the cursor, False otherwise.
+        """
+        return self.node is None
+
+    @property
+    def data(self):
+        """
+        The data of the node under the cursor.
+        """
+        if self.node is None:
+            raise IndexError("cursor is past the end of the list")
+        return self.node.data
+
+    @data.setter
+    def data(self, value):
+        if self.node is None:
+            raise IndexError("cursor is past the end of the list")
+        self.node.data = value
+
+    def moveNext(self):
+        """
+        Moves the cursor one node towards the tail.
+
+        Raises:
+            IndexError: If the cursor is already past the end.
+        """
+        if self.node is None:
+            raise IndexError("cursor is past the end of the list")
+        self.node = self.node.next
+        self.index += 1
+
+    def movePrev(self):
+        """
+        Moves the cursor one node towards the header. From past the end it
+        moves onto the tail.
+
+        Raises:
+            IndexError: If the cursor is already on the first node.
+        """
+        previous = self.linked_list.tail if self.node is None else self.node.prev
+        if previous is None:
+            raise IndexError("cursor is at the start of the list")
+        self.node = previous
+        self.index -= 1
+
+    def insertBefore(self, data):
+        """
+        Inserts a new node with the given data before the cursor, which stays
+        on its current node. Past the end this appends to the list.
+
+        Args:
+            data: The data to be stored in the new node.
+        """
+        if self.node is None:
+            self.linked_list.append(data)
+        else:
+            self.linked_list.insertBefore(self.node, data)
+        self.index += 1
+
+    def insertAfter(self, data):
+        """
+        Inserts a new node with the given data after the cursor.
+
+        Args:
+            data: The data to be stored in the new node.
+
+        Raises:
+            IndexError: If the cursor is past the end.
+        """
+        if self.node is None:
+            raise IndexError("cursor is past the end of the list")
+        self.linked_list.insertAfter(self.node, data)
+
+    def remove(self):
+        """
+        Removes the node under the cursor and moves the cursor to the next one.
+
+        Returns:
+            The data of the removed node.
+
+        Raises:
+            IndexError: If the cursor is past the end.
+        """
+        if self.node is None:
+            raise IndexError("cursor is past the end of the list")
+        n = self.node
+        self.node = n.next
+        return self.linked_list.removeNode(n)
+
+
+class PooledLinkedList:
+    """
+    A class representing a singly linked list stored in a pool of parallel
+    arrays instead of Node objects.
+
+    Node i is the pair (items[i], nexts[i]), where nexts is a typed array of
+    indices and -1 stands for "no node". Removed slots are chained into a free
+    list and reused by later inserts. Apart from the payloads themselves the
+    list allocates no Python object per element, which makes it far smaller
+    than a LinkedList of Node objects.
+
+    Attributes:
+        header: The index of the first node, or -1.
+        tail: The index of the last node, or -1.
+        size: The number of nodes in the linked list.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializes a new instance of the PooledLinkedList class.
+        """
+        self.items = []
+        self.nexts = array("q")
+        self.free = -1
+        self.header = -1
+        self.tail = -1
+        self.size = 0
+
+    def _allocate(self, data):
+        """
+        Takes a slot from the free list, or grows the pool, and stores data in it.
+
+        Returns:
+            The index of the slot.
+        """
+        index = self.free
+        if index == -1:
+            self.items.append(data)
+            self.nexts.append(-1)
+            return len(self.items) - 1
+        self.free = self.nexts[index]
+        self.items[index] = data
+        self.nexts[index] = -1
+        return index
+
+    def _release(self, index):
+        """
+        Returns a slot to the free list and drops its reference to the payload.
+
+        Returns:
+            The data that was stored in the slot.
+        """
+        data = self.items[index]
+        self.items[index] = None
+        self.nexts[index] = self.free
+        self.free = index
+        return data
+
+    def _indexAt(self, pos):
+        """
+        Returns the slot index of the node at the specified valid position.
+        """
+        index = self.header
+        nexts = self.nexts
+        for _ in range(pos):
+            index = nexts[index]
+        return index
+
+    def prepend(self, data):
+        """
+        Inserts a new node with the given data at the beginning of the linked list.
+
+        Args:
+            data: The data to be stored in the new node.
+        """
+        index = self._allocate(data)
+        self.nexts[index] = self.header
+        self.header = index
+        if self.size == 0:
+            self.tail = index
+        self.size += 1
+
+    def append(self, data):
+        """
+        Inserts a new node with the given data at the end of the linked list.
+
+        Args:
+            data: The data to be stored in the new node.
+        """
+        index = self._allocate(data)
+        if self.size == 0:
+            self.header = index
+        else:
+            self.nexts[self.tail] = index
+        self.tail = index
+        self.size += 1
+
+    def printList(self):
+        """
+        Returns a string representation of the linked list.
+
+        Returns:
+            A string containing the data of each node in the linked list, separated by commas.
+        """
+        data = ""
+        index = self.header
+        while index != -1:
+            data = data + str(self.items[index]) + ","
+            index = self.nexts[index]
+        return data
+
+    def removeFirst(self):
+        """
+        Removes and returns the data of the first node in the linked list.
+
+        Returns:
+            The data of the first node, or None if the list is empty.
+        """
+        if self.size == 0:
+            return None
+        index = self.header
+        self.header = self.nexts[index]
+        if self.size == 1:
+            self.tail = -1
+        self.size -= 1
+        return self._release(index)
+
+    def removeLast(self):
+        """
+        Removes and returns the data of the last node in the linked list.
+
+        Returns:
+            The data of the last node, or None if the list is empty.
+        """
+        if self.size == 0:
+            return None
+        if self.size == 1:
+            return self.removeFirst()
+        index = self.tail
+        self.tail = self._indexAt(self.size - 2)
+        self.nexts[self.tail] = -1
+        self.size -= 1
+        return self._release(index)
+
+    def insertAt(self, pos, data):
+        """
+        Inserts a new node with the given data at the specified position in the linked list.
+
+        Args:
+            pos: The position at which to insert the new node.
+            data: The data to be stored in the new node.
+
+        Returns:
+            None if the position is invalid, otherwise returns the data of the inserted node.
+        """
+        if pos < 0 or pos > self.size:
+            return None
+        if pos == 0:
+            self.prepend(data)
+        elif pos == self.size:
+            self.append(data)
+        else:
+            prev = self._indexAt(pos - 1)
+            index = self._allocate(data)
+            self.nexts[index] = self.nexts[prev]
+            self.nexts[prev] = index
+            self.size += 1
+        return data
+
+    def removeAt(self, pos):
+        """
+        Removes and returns the data of the node at the specified position in the linked list.
+
+        Args:
+            pos: The position of the node to remove.
+
+        Returns:
+            The data of the removed node, or None if the position is invalid.
+        """
+        if pos < 0 or pos >= self.size:
+            return None
+        if pos == 0:
+            return self.removeFirst()
+        prev = self._indexAt(pos - 1)
+        index = self.nexts[prev]
+        self.nexts[prev] = self.nexts[index]
+        if index == self.tail:
+            self.tail = prev
+        self.size -= 1
+        return self._release(index)
+
+
 # Example Usage
-list = LinkedList()
-list.append(2)
-list.prepend(1)
-list.append(4)
-list.insertAt(2, 3)
-list.removeFirst()
-list.removeLast()
-list.append(6)
-list.removeAt(0)
-print(list.printList())
-print(list.size)
+if __name__ == "__main__":
+    linked_list = LinkedList(debug=True)
+    linked_list.append(2)
+    linked_list.prepend(1)
+    linked_list.append(4)
+    linked_list.insertAt(2, 3)
+    linked_list.removeFirst()
+    linked_list.removeLast()
+    linked_list.append(6)
+    linked_list.removeAt(0)
+    print(linked_list.printList())
+    print(linked_list.size)
+    linked_list.extend(i * i for i in range(3))
+    other = LinkedList()
+    other.extend([7, 8])
+    linked_list.concat(other)
+    print(list(linked_list), list(reversed(linked_list)), len(other))
+
+    doubly = DoublyLinkedList()
+    for i in range(5):
+        doubly.append(i)
+    doubly.insertAt(2, 10)
+    doubly.removeLast()
+    print(doubly.printList(), doubly.tail.prev.data)
+
+    # Drop odd numbers and duplicate even ones in a single pass.
+    cursor = doubly.cursor()
+    while not cursor.isDone():
+        if cursor.data % 2:
+            cursor.remove()
+        else:
+            cursor.insertAfter(cursor.data)
+            cursor.moveNext()
+            cursor.moveNext()
+    print(doubly.printList(), doubly.size)
+
+    pooled = PooledLinkedList()
+    for i in range(5):
+        pooled.append(i)
+    pooled.removeAt(1)
+    pooled.insertAt(3, 9)
+    print(pooled.printList(), pooled.size)
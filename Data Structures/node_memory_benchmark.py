@@ -0,0 +1,116 @@
+# Benchmark: bytes per element of linked list and tree nodes (tracemalloc)
+
+import sys
+import tracemalloc
+
+from linked_list import LinkedList, PooledLinkedList
+from Tree.tree import Tree, TreePool
+
+
+class DictNode:
+    """
+    A linked list node with a per-instance __dict__, as Node was before it
+    declared __slots__.
+    """
+
+    def __init__(self, data) -> None:
+        self.data = data
+        self.next = None
+
+
+class DictTree:
+    """
+    A tree node with a per-instance __dict__, as Tree was before it declared
+    __slots__.
+    """
+
+    def __init__(self, data) -> None:
+        self.data = data
+        self.children = []
+        self.parent = None
+
+    def add_child(self, child):
+        child.parent = self
+        self.children.append(child)
+
+
+# The builders below allocate nothing but the structure they return: no
+# slices of the payloads and no helper lists, which would otherwise be traced
+# along with it.
+
+
+def dict_linked_list(payloads):
+    payloads = iter(payloads)
+    header = tail = DictNode(next(payloads))
+    for data in payloads:
+        tail.next = DictNode(data)
+        tail = tail.next
+    return header
+
+
+def slotted_linked_list(payloads):
+    linked_list = LinkedList()
+    for data in payloads:
+        linked_list.append(data)
+    return linked_list
+
+
+def pooled_linked_list(payloads):
+    linked_list = PooledLinkedList()
+    for data in payloads:
+        linked_list.append(data)
+    return linked_list
+
+
+def wide_tree(node_class, payloads, fanout=8, index=0):
+    """
+    Build a tree where every node gets fanout children, numbered breadth
+    first: the children of node i are nodes i * fanout + 1 onwards.
+    """
+    node = node_class(payloads[index])
+    first = index * fanout + 1
+    for child in range(first, min(first + fanout, len(payloads))):
+        node.add_child(wide_tree(node_class, payloads, fanout, child))
+    return node
+
+
+def pooled_tree(payloads, fanout=8):
+    pool = TreePool()
+    pool.add_node(payloads[0])
+    for i in range(1, len(payloads)):
+        pool.add_node(payloads[i], (i - 1) // fanout)
+    return pool
+
+
+def bytes_per_element(build, payloads):
+    """
+    Return the bytes the structure built from payloads holds per element, not
+    counting the payloads themselves, which are allocated before tracing
+    starts.
+    """
+    tracemalloc.start()
+    structure = build(payloads)
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del structure
+    return allocated / len(payloads)
+
+
+def main(n=200_000):
+    payloads = list(range(n))
+    candidates = [
+        ("Node with __dict__", dict_linked_list),
+        ("Node with __slots__", slotted_linked_list),
+        ("PooledLinkedList", pooled_linked_list),
+        ("Tree with __dict__", lambda p: wide_tree(DictTree, p)),
+        ("Tree with __slots__", lambda p: wide_tree(Tree, p)),
+        ("TreePool", pooled_tree),
+    ]
+    print(f"{n} elements")
+    print(f"{'structure':<22}{'bytes/element':>14}")
+    for name, build in candidates:
+        print(f"{name:<22}{bytes_per_element(build, payloads):>14.1f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
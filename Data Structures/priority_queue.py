@@ -1,5 +1,284 @@
-"""
-If prioriy is based on the value itself then minheap or maxheap can be considered as priority queue. If priority is supplied in a tuple then a modification is necessary.
+# Priority Queue Data Structure
 
-So, currently i'm not implementing priority queue.
-"""
\ No newline at end of file
+from Heap.heap import Heap
+from hash_table import HashTable
+
+# Fields of a heap entry. Entries are lists, so the heap compares them by
+# priority and then by sequence number, which is unique; the item itself is
+# never compared.
+PRIORITY, SEQUENCE, ITEM, INDEX = range(4)
+
+
+class _IndexedHeap(Heap):
+    """
+    A Heap of [priority, sequence, item, index] entries whose sifts keep each
+    entry's index equal to its slot. It is private to PriorityQueue, which
+    only ever stores entries in it through its own methods.
+    """
+
+    def heapifyUp(self, index):
+        """
+        Restore the heap property by moving the entry at the given index
+        upwards, keeping the index of every entry it passes up to date.
+
+        Parameters:
+        - index (int): The index of the entry.
+
+        Returns:
+        - int: The index the entry ended up at.
+        """
+        heapArr = self.heapArr
+        entry = heapArr[index]
+        while index > 0:
+            parentIndex = (index - 1) >> 1
+            parent = heapArr[parentIndex]
+            if not entry < parent:
+                break
+            heapArr[index] = parent
+            parent[INDEX] = index
+            index = parentIndex
+        heapArr[index] = entry
+        entry[INDEX] = index
+        return index
+
+    def heapifyDown(self, index):
+        """
+        Restore the heap property by moving the entry at the given index
+        downwards, keeping the index of every entry it passes up to date.
+
+        Parameters:
+        - index (int): The index of the entry.
+
+        Returns:
+        - int: The index the entry ended up at.
+        """
+        heapArr = self.heapArr
+        count = self.count
+        entry = heapArr[index]
+        child = 2 * index + 1
+        while child < count:
+            right = child + 1
+            if right < count and heapArr[right] < heapArr[child]:
+                child = right
+            smaller = heapArr[child]
+            if not smaller < entry:
+                break
+            heapArr[index] = smaller
+            smaller[INDEX] = index
+            index = child
+            child = 2 * index + 1
+        heapArr[index] = entry
+        entry[INDEX] = index
+        return index
+
+
+class PriorityQueue:
+    """
+    A min-priority queue of distinct, hashable items, with O(log n)
+    update_priority and remove.
+
+    This is an indexed binary heap. Every item is stored in an entry
+    [priority, sequence, item, index], where index is the entry's slot in the
+    heap; the sifts keep it current as they move entries. A HashTable maps
+    each item to its entry, so an item can be found, re-prioritised or removed
+    without searching the heap.
+
+    The sequence number counts pushes, so items of equal priority come out in
+    the order they were pushed.
+
+    Attributes:
+    - heap: The heap of entries.
+    - entries: The HashTable mapping each item to its heap entry.
+    """
+
+    def __init__(self, size=8) -> None:
+        """
+        Initialize an empty priority queue.
+
+        Parameters:
+        - size (int): The initial size of the heap.
+        """
+        self.heap = _IndexedHeap(size)
+        self.entries = HashTable(16, 0.75)
+        self.sequence = 0
+
+    @classmethod
+    def fromIterable(cls, data, size=None):
+        """
+        Build a priority queue from (item, priority) pairs in O(n) time.
+
+        Parameters:
+        - data (iterable): The (item, priority) pairs.
+        - size (int): The size of the heap; at least the number of pairs,
+        which is the default.
+
+        Returns:
+        - PriorityQueue: A priority queue holding the items of data.
+
+        Raises:
+        - ValueError: If an item appears more than once.
+        """
+        pairs = list(data)
+        queue = cls(max(len(pairs), size or 0))
+        for item, priority in pairs:
+            queue._add(item, priority)
+        for index in range(queue.heap.count // 2 - 1, -1, -1):
+            queue.heap.heapifyDown(index)
+        return queue
+
+    def __len__(self):
+        return self.heap.count
+
+    def __contains__(self, item):
+        return item in self.entries
+
+    def _add(self, item, priority):
+        """
+        Store a new entry for item in the next free slot, without sifting it.
+
+        Raises:
+        - ValueError: If item is already in the queue.
+        """
+        if item in self.entries:
+            raise ValueError(f"{item!r} is already in the priority queue")
+        heap = self.heap
+        if heap.count == heap.size:
+            heap.resize(max(1, heap.size * 2))
+        entry = [priority, self.sequence, item, heap.count]
+        self.sequence += 1
+        self.entries[item] = entry
+        heap.heapArr[heap.count] = entry
+        heap.count += 1
+
+    def push(self, item, priority):
+        """
+        Add an item with the given priority.
+
+        Parameters:
+        - item: The item to add; it must be hashable.
+        - priority: The priority of the item; lower comes out first.
+
+        Raises:
+        - ValueError: If item is already in the queue; use update_priority
+        to change its priority.
+        """
+        self._add(item, priority)
+        self.heap.heapifyUp(self.heap.count - 1)
+
+    def pop(self):
+        """
+        Remove and return the item with the lowest priority.
+
+        Returns:
+        - tuple: The (item, priority) pair.
+
+        Raises:
+        - IndexError: If the queue is empty.
+        """
+        if self.heap.count == 0:
+            raise IndexError("pop from an empty priority queue")
+        entry = self.heap.remove()
+        del self.entries[entry[ITEM]]
+        return entry[ITEM], entry[PRIORITY]
+
+    def peek(self):
+        """
+        Return the item with the lowest priority without removing it.
+
+        Returns:
+        - tuple: The (item, priority) pair, or None if the queue is empty.
+        """
+        if self.heap.count == 0:
+            return None
+        entry = self.heap.heapArr[0]
+        return entry[ITEM], entry[PRIORITY]
+
+    def priority(self, item):
+        """
+        Return the priority of an item.
+
+        Raises:
+        - KeyError: If item is not in the queue.
+        """
+        return self.entries[item][PRIORITY]
+
+    def update_priority(self, item, priority):
+        """
+        Change the priority of an item, moving it up or down the heap. It
+        keeps its place among items of equal priority.
+
+        Parameters:
+        - item: The item to update.
+        - priority: The new priority.
+
+        Raises:
+        - KeyError: If item is not in the queue.
+        """
+        entry = self.entries[item]
+        entry[PRIORITY] = priority
+        index = entry[INDEX]
+        if self.heap.heapifyUp(index) == index:
+            self.heap.heapifyDown(index)
+
+    def remove(self, item):
+        """
+        Remove an item, wherever it is in the heap.
+
+        Parameters:
+        - item: The item to remove.
+
+        Returns:
+        - The priority the item had.
+
+        Raises:
+        - KeyError: If item is not in the queue.
+        """
+        entry = self.entries[item]
+        del self.entries[item]
+        heap = self.heap
+        index = entry[INDEX]
+        heap.count -= 1
+        last = heap.heapArr[heap.count]
+        heap.heapArr[heap.count] = None
+        if index < heap.count:
+            heap.heapArr[index] = last
+            if heap.heapifyUp(index) == index:
+                heap.heapifyDown(index)
+        return entry[PRIORITY]
+
+    def clear(self):
+        """
+        Remove every item from the queue.
+        """
+        self.heap.clear()
+        self.entries.clear()
+
+
+if __name__ == "__main__":
+    # Example Usage: Dijkstra's shortest paths
+    graph = {
+        "a": {"b": 4, "c": 1},
+        "b": {"d": 1},
+        "c": {"b": 2, "d": 5},
+        "d": {},
+    }
+    distances = {}
+    queue = PriorityQueue()
+    queue.push("a", 0)
+    while queue:
+        node, distance = queue.pop()
+        distances[node] = distance
+        for neighbour, weight in graph[node].items():
+            if neighbour in distances:
+                continue
+            if neighbour not in queue:
+                queue.push(neighbour, distance + weight)
+            elif distance + weight < queue.priority(neighbour):
+                queue.update_priority(neighbour, distance + weight)
+    print("Shortest distances from a:", distances)
+
+    jobs = PriorityQueue()
+    for job in ["backup", "email", "report"]:
+        jobs.push(job, 1)
+    jobs.push("alert", 0)
+    print("Run order:", [jobs.pop()[0] for _ in range(len(jobs))])
@@ -1,5 +1,8 @@
 # Queue Data Structure
 
+import threading
+import time
+
 
 class Queue:
     """
@@ -20,11 +23,20 @@ class Queue:
 
     Time complexity: O(1)
     Space complexity: O(n)
+
+    Dequeued items are not shifted out of the list one by one: a head index
+    moves past them instead, and the consumed prefix is cut off in one slice
+    once it makes up half of the list. Every item is therefore moved at most
+    once, which keeps dequeue O(1) amortized.
     """
 
+    # Never compact for fewer consumed slots than this.
+    COMPACT_MIN = 32
+
     def __init__(self):
         """Initialize an empty queue."""
         self.items = []
+        self.head = 0
 
     def enqueue(self, item):
         """Add an item to the rear of the queue."""
@@ -41,7 +53,13 @@ class Queue:
         - IndexError: If the queue is empty.
         """
         if not self.is_empty():
-            return self.items.pop(0)
+            item = self.items[self.head]
+            self.items[self.head] = None
+            self.head += 1
+            if self.head >= self.COMPACT_MIN and self.head * 2 >= len(self.items):
+                del self.items[: self.head]
+                self.head = 0
+            return item
         else:
             raise IndexError("dequeue from empty queue")
 
@@ -53,7 +71,7 @@ class Queue:
         - item: The item at the front of the queue, or None if the queue is empty.
         """
         if not self.is_empty():
-            return self.items[0]
+            return self.items[self.head]
         else:
             return None
 
@@ -64,7 +82,7 @@ class Queue:
         Returns:
         - bool: True if the queue is empty, False otherwise.
         """
-        return len(self.items) == 0
+        return self.head == len(self.items)
 
     def size(self):
         """
@@ -73,7 +91,7 @@ class Queue:
         Returns:
         - int: The number of items in the queue.
         """
-        return len(self.items)
+        return len(self.items) - self.head
 
     def __str__(self):
         """
@@ -82,7 +100,107 @@ class Queue:
         Returns:
         - str: A string representation of the queue.
         """
-        return str(self.items)
+        return str(self.items[self.head :])
+
+
+class BlockingQueue:
+    """
+    A thread-safe, bounded FIFO queue for handing work between producer and
+    consumer threads.
+
+    put blocks while the queue is full, which pushes back on producers that
+    outrun their consumers, and get blocks while it is empty. Both accept a
+    timeout and raise TimeoutError when it expires.
+    """
+
+    def __init__(self, maxsize=0):
+        """
+        Initialize an empty blocking queue.
+
+        Parameters:
+        - maxsize (int): The maximum number of items, or 0 for no limit.
+        """
+        self.maxsize = maxsize
+        self.queue = Queue()
+        self.lock = threading.Lock()
+        self.not_empty = threading.Condition(self.lock)
+        self.not_full = threading.Condition(self.lock)
+
+    def _wait(self, condition, ready, timeout):
+        """
+        Wait on condition, with the lock held, until ready() is true.
+
+        Raises:
+        - TimeoutError: If ready() is still false after timeout seconds.
+        """
+        if timeout is None:
+            while not ready():
+                condition.wait()
+            return
+        deadline = time.monotonic() + timeout
+        while not ready():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError("timed out waiting on the queue")
+            condition.wait(remaining)
+
+    def put(self, item, timeout=None):
+        """
+        Add an item to the rear of the queue, waiting for room if it is full.
+
+        Parameters:
+        - item: The item to add.
+        - timeout (float): The longest to wait in seconds; None waits forever
+        and 0 does not wait at all.
+
+        Raises:
+        - TimeoutError: If the queue is still full after timeout seconds.
+        """
+        with self.not_full:
+            self._wait(self.not_full, lambda: not self.is_full(), timeout)
+            self.queue.enqueue(item)
+            self.not_empty.notify()
+
+    def get(self, timeout=None):
+        """
+        Remove and return the item at the front of the queue, waiting for one
+        if it is empty.
+
+        Parameters:
+        - timeout (float): The longest to wait in seconds; None waits forever
+        and 0 does not wait at all.
+
+        Returns:
+        - item: The item at the front of the queue.
+
+        Raises:
+        - TimeoutError: If the queue is still empty after timeout seconds.
+        """
+        with self.not_empty:
+            self._wait(self.not_empty, lambda: not self.queue.is_empty(), timeout)
+            item = self.queue.dequeue()
+            self.not_full.notify()
+            return item
+
+    def is_empty(self):
+        """
+        Check if the queue is empty. The answer may be stale by the time it is
+        used if other threads share the queue.
+        """
+        return self.queue.is_empty()
+
+    def is_full(self):
+        """
+        Check if the queue is full. The answer may be stale by the time it is
+        used if other threads share the queue.
+        """
+        return 0 < self.maxsize <= self.queue.size()
+
+    def size(self):
+        """
+        Return the number of items in the queue.
+        """
+        return self.queue.size()
 
 
 # Example usage:
@@ -96,3 +214,15 @@ if __name__ == "__main__":
     print("Dequeue:", q.dequeue())
     print("Queue after dequeue:", q)
     print("Peek:", q.peek())
+
+    handoff = BlockingQueue(maxsize=2)
+
+    def consume():
+        for _ in range(5):
+            print("Consumed:", handoff.get(timeout=1))
+
+    consumer = threading.Thread(target=consume)
+    consumer.start()
+    for i in range(5):
+        handoff.put(i, timeout=1)
+    consumer.join()
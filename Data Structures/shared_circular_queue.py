@@ -0,0 +1,325 @@
+import platform
+import struct
+import sys
+from multiprocessing import resource_tracker, shared_memory
+
+# Machines whose memory model gives the ordering SharedCircularQueue needs.
+_SUPPORTED_MACHINES = ("x86_64", "amd64")
+
+
+def _check_machine():
+    """
+    Raises:
+        RuntimeError: If this machine is not x86-64.
+    """
+    machine = platform.machine()
+    if machine.lower() not in _SUPPORTED_MACHINES:
+        raise RuntimeError(
+            f"SharedCircularQueue relies on x86-64 store ordering; {machine!r} "
+            "could let the consumer read a record before it is fully written"
+        )
+
+
+def _open_untracked(name):
+    """
+    Open an existing shared memory segment without registering it with this
+    process's resource tracker, which would otherwise unlink it as soon as
+    this process exits, out from under the process that created it.
+    """
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    # Before 3.13 every SharedMemory registers itself. Unregistering
+    # afterwards is not enough: a forked child shares its parent's tracker,
+    # so it would drop the creator's registration too. Skip registering
+    # instead.
+    register = resource_tracker.register
+    resource_tracker.register = lambda name, rtype: None
+    try:
+        return shared_memory.SharedMemory(name=name)
+    finally:
+        resource_tracker.register = register
+
+
+class SharedCircularQueue:
+    """
+    A single-producer, single-consumer circular queue of fixed-size records
+    kept in shared memory, so that two processes can pass records to each
+    other without pickling them or taking a lock.
+
+    The segment starts with a header holding the capacity and record size,
+    followed by the tail and head counters and then capacity slots of
+    record_size bytes each. The counters only ever increase and a counter c
+    refers to slot c % capacity, so the queue holds tail - head records. Only
+    the producer writes tail and only the consumer writes head, each on its
+    own cache line. The producer fills a slot before publishing the new tail,
+    and the consumer reads a slot before publishing the new head, so neither
+    side ever sees a slot the other is still using.
+
+    This relies on aligned 8-byte stores being atomic and on stores becoming
+    visible to the other process in program order, which holds on x86-64, so
+    the queue refuses to run on any other machine. Exactly one process may
+    enqueue and exactly one may dequeue.
+
+    The creating process owns the segment and should unlink it once both
+    sides are done; the other process joins it with attach(name).
+
+    Attributes:
+        name: The name of the shared memory segment.
+        capacity: The number of record slots.
+        record_size: The size of every record in bytes.
+    """
+
+    _HEADER = struct.Struct("<QQ")
+    _COUNTER = struct.Struct("<Q")
+    # Keep each counter on its own cache line so the two sides do not
+    # invalidate each other's line on every update.
+    _TAIL = 64
+    _HEAD = 128
+    _SLOTS = 192
+
+    def __init__(self, capacity: int, record_size: int, name: str = None) -> None:
+        """
+        Create a shared circular queue in a new shared memory segment.
+
+        Args:
+            capacity (int): The number of records the queue can hold.
+            record_size (int): The size of every record in bytes.
+            name (str): The name for the segment, or None for a random one.
+
+        Raises:
+            ValueError: If capacity or record_size is not positive.
+            RuntimeError: If this machine is not x86-64.
+        """
+        _check_machine()
+        if capacity < 1:
+            raise ValueError("capacity must be positive")
+        if record_size < 1:
+            raise ValueError("record_size must be positive")
+        shm = shared_memory.SharedMemory(
+            name=name, create=True, size=self._SLOTS + capacity * record_size
+        )
+        self._HEADER.pack_into(shm.buf, 0, capacity, record_size)
+        self._COUNTER.pack_into(shm.buf, self._TAIL, 0)
+        self._COUNTER.pack_into(shm.buf, self._HEAD, 0)
+        self._open(shm)
+
+    @classmethod
+    def attach(cls, name: str) -> "SharedCircularQueue":
+        """
+        Join a shared circular queue created by another process.
+
+        Args:
+            name (str): The name of the queue's shared memory segment.
+
+        Returns:
+            SharedCircularQueue: A queue backed by the same segment.
+
+        Raises:
+            RuntimeError: If this machine is not x86-64.
+        """
+        _check_machine()
+        queue = cls.__new__(cls)
+        queue._open(_open_untracked(name))
+        return queue
+
+    def _open(self, shm) -> None:
+        self._shm = shm
+        self._buf = shm.buf
+        self.capacity, self.record_size = self._HEADER.unpack_from(self._buf, 0)
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    def _tail(self) -> int:
+        return self._COUNTER.unpack_from(self._buf, self._TAIL)[0]
+
+    def _head(self) -> int:
+        return self._COUNTER.unpack_from(self._buf, self._HEAD)[0]
+
+    def __len__(self) -> int:
+        return self._tail() - self._head()
+
+    def isEmpty(self) -> bool:
+        """
+        Check if the queue is empty. The answer may be stale by the time it is
+        used, unless the caller is the producer and it is False.
+
+        Returns:
+            bool: True if the queue is empty, False otherwise.
+        """
+        return self._tail() == self._head()
+
+    def isFull(self) -> bool:
+        """
+        Check if the queue is full. The answer may be stale by the time it is
+        used, unless the caller is the consumer and it is False.
+
+        Returns:
+            bool: True if the queue is full, False otherwise.
+        """
+        return self._tail() - self._head() == self.capacity
+
+    def _write(self, tail: int, data) -> None:
+        """
+        Copy whole records into the slots starting at counter tail, in at most
+        two slices.
+        """
+        size = self.record_size
+        slot = tail % self.capacity
+        first = min(len(data), (self.capacity - slot) * size)
+        start = self._SLOTS + slot * size
+        self._buf[start:start + first] = data[:first]
+        if first < len(data):
+            self._buf[self._SLOTS:self._SLOTS + len(data) - first] = data[first:]
+
+    def _read(self, head: int, n: int) -> bytes:
+        """
+        Copy n records out of the slots starting at counter head, in at most
+        two slices.
+        """
+        size = self.record_size
+        slot = head % self.capacity
+        first = min(n, self.capacity - slot) * size
+        start = self._SLOTS + slot * size
+        data = bytes(self._buf[start:start + first])
+        if first < n * size:
+            data += bytes(self._buf[self._SLOTS:self._SLOTS + n * size - first])
+        return data
+
+    def enqueue(self, record) -> None:
+        """
+        Add a record to the rear of the queue. Only the producer may call this.
+
+        Args:
+            record: A bytes-like object of exactly record_size bytes.
+
+        Raises:
+            ValueError: If the record is not record_size bytes long.
+            OverflowError: If the queue is full.
+        """
+        if len(record) != self.record_size:
+            raise ValueError(f"record must be {self.record_size} bytes")
+        tail = self._tail()
+        if tail - self._head() == self.capacity:
+            raise OverflowError("enqueue to a full circular queue")
+        self._write(tail, record)
+        self._COUNTER.pack_into(self._buf, self._TAIL, tail + 1)
+
+    def enqueueMany(self, records) -> None:
+        """
+        Add records to the rear of the queue, in order, publishing them all at
+        once. Either all of the records are added or, if they do not fit, none
+        are. Only the producer may call this.
+
+        Args:
+            records: An iterable of bytes-like objects of record_size bytes.
+
+        Raises:
+            ValueError: If a record is not record_size bytes long.
+            OverflowError: If the records do not all fit.
+        """
+        records = list(records)
+        if any(len(record) != self.record_size for record in records):
+            raise ValueError(f"records must be {self.record_size} bytes")
+        data = b"".join(records)
+        n = len(records)
+        tail = self._tail()
+        if tail - self._head() + n > self.capacity:
+            raise OverflowError("enqueue to a full circular queue")
+        self._write(tail, data)
+        self._COUNTER.pack_into(self._buf, self._TAIL, tail + n)
+
+    def dequeue(self) -> bytes:
+        """
+        Remove and return the record at the front of the queue. Only the
+        consumer may call this.
+
+        Returns:
+            bytes: The record at the front of the queue.
+
+        Raises:
+            IndexError: If the queue is empty.
+        """
+        head = self._head()
+        if self._tail() == head:
+            raise IndexError("dequeue from an empty circular queue")
+        record = self._read(head, 1)
+        self._COUNTER.pack_into(self._buf, self._HEAD, head + 1)
+        return record
+
+    def dequeueMany(self, n: int) -> list:
+        """
+        Remove and return up to n records from the front of the queue. Only
+        the consumer may call this.
+
+        Args:
+            n (int): The largest number of records to remove.
+
+        Returns:
+            list: The removed records, front first; shorter than n if the
+                queue held fewer records.
+        """
+        head = self._head()
+        n = max(0, min(n, self._tail() - head))
+        data = self._read(head, n)
+        self._COUNTER.pack_into(self._buf, self._HEAD, head + n)
+        size = self.record_size
+        return [data[i:i + size] for i in range(0, len(data), size)]
+
+    def peek(self):
+        """
+        Peek at the record at the front of the queue. Only the consumer may
+        call this.
+
+        Returns:
+            The record at the front of the queue, or None if the queue is empty.
+        """
+        head = self._head()
+        if self._tail() == head:
+            return None
+        return self._read(head, 1)
+
+    def close(self) -> None:
+        """
+        Detach this process from the shared memory segment.
+        """
+        self._buf = None
+        self._shm.close()
+
+    def unlink(self) -> None:
+        """
+        Destroy the shared memory segment. Call this once, from the creating
+        process, after both sides have closed their queues.
+        """
+        self._shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+if __name__ == "__main__":
+    # Example Usage
+    from multiprocessing import Process
+
+    def consume(name, count):
+        with SharedCircularQueue.attach(name) as inbox:
+            received = 0
+            while received < count:
+                for record in inbox.dequeueMany(count):
+                    print("consumed:", struct.unpack("<Qd", record))
+                    received += 1
+
+    RECORD = struct.Struct("<Qd")
+    with SharedCircularQueue(4, RECORD.size) as outbox:
+        consumer = Process(target=consume, args=(outbox.name, 8))
+        consumer.start()
+        for i in range(8):
+            while outbox.isFull():
+                pass
+            outbox.enqueue(RECORD.pack(i, i / 2))
+        consumer.join()
+        outbox.unlink()
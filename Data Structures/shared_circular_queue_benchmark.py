@@ -0,0 +1,91 @@
+# Benchmark: SharedCircularQueue vs multiprocessing.Queue between two processes
+
+import sys
+
+# queue.py in this folder shadows the standard library queue module, which
+# multiprocessing.queues needs; look in this folder last.
+sys.path.append(sys.path.pop(0))
+
+import multiprocessing
+import struct
+import time
+
+from shared_circular_queue import SharedCircularQueue
+
+RECORD = struct.Struct("<Qd48x")
+BATCH = 256
+
+
+def mp_producer(queue, n):
+    for i in range(n):
+        queue.put(RECORD.pack(i, i))
+
+
+def mp_consumer(queue, n):
+    for _ in range(n):
+        queue.get()
+
+
+def shared_producer(name, n):
+    with SharedCircularQueue.attach(name) as queue:
+        for i in range(n):
+            while queue.isFull():
+                pass
+            queue.enqueue(RECORD.pack(i, i))
+
+
+def shared_consumer(queue, n):
+    received = 0
+    while received < n:
+        if not queue.isEmpty():
+            queue.dequeue()
+            received += 1
+
+
+def batched_producer(name, n):
+    with SharedCircularQueue.attach(name) as queue:
+        for start in range(0, n, BATCH):
+            batch = [RECORD.pack(i, i) for i in range(start, min(start + BATCH, n))]
+            while queue.capacity - len(queue) < len(batch):
+                pass
+            queue.enqueueMany(batch)
+
+
+def batched_consumer(queue, n):
+    received = 0
+    while received < n:
+        received += len(queue.dequeueMany(BATCH))
+
+
+def rate(producer, consumer, queue, handle, n):
+    """
+    Run producer in a child process and consumer here, and return the
+    messages per second from start until the last one is received.
+    """
+    child = multiprocessing.Process(target=producer, args=(handle, n))
+    start = time.perf_counter()
+    child.start()
+    consumer(queue, n)
+    elapsed = time.perf_counter() - start
+    child.join()
+    return n / elapsed
+
+
+def main():
+    n = 200_000
+    print(f"{RECORD.size}-byte records, {n} messages")
+
+    queue = multiprocessing.Queue(maxsize=1024)
+    print(f"{'multiprocessing.Queue':<32}{rate(mp_producer, mp_consumer, queue, queue, n):>12,.0f} msg/s")
+
+    for label, producer, consumer in (
+        ("SharedCircularQueue", shared_producer, shared_consumer),
+        (f"SharedCircularQueue, batch {BATCH}", batched_producer, batched_consumer),
+    ):
+        with SharedCircularQueue(1024, RECORD.size) as queue:
+            print(f"{label:<32}{rate(producer, consumer, queue, queue.name, n):>12,.0f} msg/s")
+            queue.unlink()
+
+
+if __name__ == "__main__":
+    main()
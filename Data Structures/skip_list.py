@@ -0,0 +1,237 @@
+from random import getrandbits
+
+MAX_LEVEL = 32
+
+
+class SkipNode:
+    """
+    A class representing a node in an indexable skip list.
+
+    Attributes:
+        data: The data stored in the node.
+        next: The forward pointer at each level of the node.
+        width: For each level, how many positions the forward pointer skips.
+    """
+
+    __slots__ = ("data", "next", "width")
+
+    def __init__(self, data, level) -> None:
+        self.data = data
+        self.next = [None] * level
+        self.width = [1] * level
+
+
+class IndexableSkipList:
+    """
+    A class representing a sequence stored as an indexable skip list.
+
+    It offers the positional API of LinkedList, but every node also has a random
+    number of forward pointers that skip ahead exponentially far, and each
+    pointer records its span (how many positions it skips). Walking towards a
+    position follows the widest spans that do not overshoot it, so indexing,
+    insertAt and removeAt take O(log n) steps with high probability instead of
+    walking O(pos) nodes.
+
+    The span of a pointer that runs off the end is the distance to one past
+    the last element, so spans stay consistent at every level.
+
+    Attributes:
+        head: A sentinel node that sits at position 0, before the first element.
+        levels: The number of levels currently in use.
+        size: The number of elements in the list.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializes a new instance of the IndexableSkipList class.
+        """
+        self.head = SkipNode(None, MAX_LEVEL)
+        self.levels = 1
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def __iter__(self):
+        """
+        Yields the elements in order along the bottom level.
+        """
+        current = self.head.next[0]
+        while current is not None:
+            yield current.data
+            current = current.next[0]
+
+    @staticmethod
+    def _randomLevel():
+        """
+        Returns a level where each extra level has probability 1/2.
+        """
+        level = 1
+        bits = getrandbits(MAX_LEVEL - 1)
+        while bits & 1:
+            level += 1
+            bits >>= 1
+        return level
+
+    def _nodeAt(self, pos):
+        """
+        Returns the node at the specified valid position.
+        """
+        target = pos + 1
+        current = self.head
+        traversed = 0
+        for i in range(self.levels - 1, -1, -1):
+            while current.next[i] is not None and traversed + current.width[i] <= target:
+                traversed += current.width[i]
+                current = current.next[i]
+        return current
+
+    def _predecessors(self, pos):
+        """
+        Finds, at every level in use, the last node before the specified
+        position, together with that node's own position (the head is 0 and the
+        element at pos is pos + 1).
+        """
+        update = [None] * self.levels
+        steps = [0] * self.levels
+        current = self.head
+        traversed = 0
+        for i in range(self.levels - 1, -1, -1):
+            while current.next[i] is not None and traversed + current.width[i] <= pos:
+                traversed += current.width[i]
+                current = current.next[i]
+            update[i] = current
+            steps[i] = traversed
+        return update, steps
+
+    def get(self, pos):
+        """
+        Returns the element at the specified position.
+
+        Args:
+            pos: The position of the element.
+
+        Returns:
+            The element at that position, or None if the position is invalid.
+        """
+        if pos < 0 or pos >= self.size:
+            return None
+        return self._nodeAt(pos).data
+
+    def __getitem__(self, pos):
+        """
+        Returns the element at the specified position; negative positions
+        count from the end.
+
+        Raises:
+            IndexError: If the position is out of range.
+        """
+        if pos < 0:
+            pos += self.size
+        if pos < 0 or pos >= self.size:
+            raise IndexError("list index out of range")
+        return self._nodeAt(pos).data
+
+    def insertAt(self, pos, data):
+        """
+        Inserts the given data at the specified position.
+
+        Args:
+            pos: The position at which to insert the data.
+            data: The data to be inserted.
+
+        Returns:
+            None if the position is invalid, otherwise returns the inserted data.
+        """
+        if pos < 0 or pos > self.size:
+            return None
+        level = self._randomLevel()
+        head = self.head
+        if level > self.levels:
+            # Levels coming into use start out as one span over the whole list.
+            for i in range(self.levels, level):
+                head.next[i] = None
+                head.width[i] = self.size + 1
+            self.levels = level
+        update, steps = self._predecessors(pos)
+        n = SkipNode(data, level)
+        for i in range(level):
+            prev = update[i]
+            n.next[i] = prev.next[i]
+            prev.next[i] = n
+            n.width[i] = prev.width[i] - (pos - steps[i])
+            prev.width[i] = pos + 1 - steps[i]
+        for i in range(level, self.levels):
+            update[i].width[i] += 1
+        self.size += 1
+        return data
+
+    def removeAt(self, pos):
+        """
+        Removes and returns the element at the specified position.
+
+        Args:
+            pos: The position of the element to remove.
+
+        Returns:
+            The removed element, or None if the position is invalid.
+        """
+        if pos < 0 or pos >= self.size:
+            return None
+        update, _ = self._predecessors(pos)
+        target = update[0].next[0]
+        for i in range(self.levels):
+            prev = update[i]
+            if prev.next[i] is target:
+                prev.width[i] += target.width[i] - 1
+                prev.next[i] = target.next[i]
+            else:
+                prev.width[i] -= 1
+        while self.levels > 1 and self.head.next[self.levels - 1] is None:
+            self.levels -= 1
+        self.size -= 1
+        return target.data
+
+    def prepend(self, data):
+        """
+        Inserts the given data at the beginning of the list.
+        """
+        self.insertAt(0, data)
+
+    def append(self, data):
+        """
+        Inserts the given data at the end of the list.
+        """
+        self.insertAt(self.size, data)
+
+    def removeFirst(self):
+        """
+        Removes and returns the first element, or None if the list is empty.
+        """
+        return self.removeAt(0)
+
+    def removeLast(self):
+        """
+        Removes and returns the last element, or None if the list is empty.
+        """
+        return self.removeAt(self.size - 1)
+
+    def printList(self):
+        """
+        Returns a string representation of the list.
+
+        Returns:
+            A string containing each element of the list, separated by commas.
+        """
+        return "".join(str(data) + "," for data in self)
+
+
+# Example Usage
+if __name__ == "__main__":
+    skip_list = IndexableSkipList()
+    for i in range(10):
+        skip_list.append(i)
+    skip_list.insertAt(5, 50)
+    skip_list.removeAt(0)
+    skip_list.prepend(-1)
+    print(skip_list.printList(), skip_list.size, skip_list[5], skip_list.levels)
@@ -1,5 +1,7 @@
 # Stack Data Structure
 
+from array import array
+
 
 class Stack:
     """
@@ -76,16 +78,193 @@ class Stack:
         """
         return len(self.stack)
 
+    def push_many(self, items):
+        """
+        Add items to the top of the stack, in order, so that the last one ends
+        up on top.
+
+        Parameters:
+        - items: An iterable of the items to add.
+        """
+        self.stack.extend(items)
+
+    def pop_many(self, n):
+        """
+        Remove and return the n items at the top of the stack, in the order
+        pop would return them.
+
+        Parameters:
+        - n (int): The number of items to remove.
+
+        Returns:
+        - list: The removed items, top first.
+
+        Raises:
+        - IndexError: If the stack holds fewer than n items.
+        """
+        if n > self.size():
+            raise IndexError("pop from empty stack")
+        if n <= 0:
+            return []
+        items = self.stack[-n:]
+        del self.stack[-n:]
+        items.reverse()
+        return items
+
+
+class TypedStack(Stack):
+    """
+    A stack of numbers of a single type, stored unboxed in an array.array.
+
+    The typecode is one of array's: e.g. "q" for 64-bit ints or "d" for
+    doubles. Each element then takes its raw size (8 bytes for both) rather
+    than a pointer to a Python object.
+
+    The array is never shrunk: popping just moves _top down, the number of
+    live elements, and later pushes reuse the slots above it. reserve(n)
+    grows the array up front so that n elements can be pushed without it
+    being reallocated.
+
+    Attributes:
+    - stack: The array; only its first _top slots are live.
+    - typecode: The array typecode of the elements.
+    """
+
+    def __init__(self, typecode="d"):
+        """
+        Initialize an empty typed stack.
+
+        Parameters:
+        - typecode (str): The array.array typecode of the elements.
+        """
+        self.typecode = typecode
+        self.stack = array(typecode)
+        self._top = 0
+
+    def reserve(self, n):
+        """
+        Make room for n elements in total without reallocating.
+
+        Parameters:
+        - n (int): The number of elements to make room for.
+        """
+        if n > len(self.stack):
+            self.stack.frombytes(bytes((n - len(self.stack)) * self.stack.itemsize))
+
+    def push(self, item):
+        """Add an item to the top of the stack."""
+        if self._top < len(self.stack):
+            self.stack[self._top] = item
+        else:
+            self.stack.append(item)
+        self._top += 1
+
+    def pop(self):
+        """
+        Remove and return the item at the top of the stack.
+
+        Returns:
+        - item: The item at the top of the stack.
+
+        Raises:
+        - IndexError: If the stack is empty.
+        """
+        if self._top == 0:
+            raise IndexError("pop from empty stack")
+        self._top -= 1
+        return self.stack[self._top]
+
+    def peek(self):
+        """
+        Return the item at the top of the stack without removing it.
+
+        Returns:
+        - item: The item at the top of the stack.
+
+        Raises:
+        - IndexError: If the stack is empty.
+        """
+        if self._top == 0:
+            raise IndexError("peek from empty stack")
+        return self.stack[self._top - 1]
+
+    def is_empty(self):
+        """
+        Check if the stack is empty.
+
+        Returns:
+        - bool: True if the stack is empty, False otherwise.
+        """
+        return self._top == 0
+
+    def size(self):
+        """
+        Return the number of items in the stack.
+
+        Returns:
+        - int: The number of items in the stack.
+        """
+        return self._top
+
+    def push_many(self, items):
+        """
+        Add items to the top of the stack, in order, so that the last one ends
+        up on top. They are copied in as one slice.
+
+        Parameters:
+        - items: An iterable of the items to add, or an array of the same
+        typecode.
+        """
+        if not isinstance(items, array) or items.typecode != self.typecode:
+            items = array(self.typecode, items)
+        end = self._top + len(items)
+        if end > len(self.stack):
+            del self.stack[self._top:]
+            self.stack.extend(items)
+        else:
+            self.stack[self._top:end] = items
+        self._top = end
+
+    def pop_many(self, n):
+        """
+        Remove and return the n items at the top of the stack, in the order
+        pop would return them. They are copied out as one slice.
+
+        Parameters:
+        - n (int): The number of items to remove.
+
+        Returns:
+        - array: The removed items, top first.
+
+        Raises:
+        - IndexError: If the stack holds fewer than n items.
+        """
+        if n > self._top:
+            raise IndexError("pop from empty stack")
+        if n <= 0:
+            return array(self.typecode)
+        items = self.stack[self._top - n:self._top]
+        items.reverse()
+        self._top -= n
+        return items
+
+
+if __name__ == "__main__":
+    # Example usage:
+    stack = Stack()
+    stack.push(5)
+    stack.push(10)
+    stack.push(15)
 
-# Example usage:
-stack = Stack()
-stack.push(5)
-stack.push(10)
-stack.push(15)
+    print("Stack size:", stack.size())
+    print("Peek top element:", stack.peek())
 
-print("Stack size:", stack.size())
-print("Peek top element:", stack.peek())
+    print("Pop:", stack.pop())
+    print("Stack size:", stack.size())
+    print("Stack: ", stack.stack)
 
-print("Pop:", stack.pop())
-print("Stack size:", stack.size())
-print("Stack: ", stack.stack)
+    numbers = TypedStack("q")
+    numbers.reserve(1000)
+    numbers.push_many(range(10))
+    print("Pop many:", numbers.pop_many(3).tolist())
+    print("Typed stack size:", numbers.size())
@@ -0,0 +1,285 @@
+class UnrolledNode:
+    """
+    A class representing a node in an unrolled linked list.
+
+    Attributes:
+        items: A list of up to capacity elements stored in the node.
+        next: A reference to the next node in the linked list.
+        prev: A reference to the previous node in the linked list.
+    """
+
+    __slots__ = ("items", "next", "prev")
+
+    def __init__(self, items) -> None:
+        self.items = items
+        self.next = None
+        self.prev = None
+
+
+class UnrolledLinkedList:
+    """
+    A class representing an unrolled linked list.
+
+    Each node holds a small array of up to capacity elements instead of a single
+    datum, so traversal follows one pointer per block of elements rather than
+    per element and positional access skips whole nodes at a time. A full node
+    is split in two on insert, and a node that falls below half full is merged
+    with its successor when both fit in one node.
+
+    Attributes:
+        header: A reference to the first node in the linked list.
+        tail: A reference to the last node in the linked list.
+        size: The number of elements in the linked list.
+        capacity: The maximum number of elements per node.
+    """
+
+    def __init__(self, capacity=32) -> None:
+        """
+        Initializes a new instance of the UnrolledLinkedList class.
+
+        Args:
+            capacity: The maximum number of elements per node (at least 2).
+        """
+        if capacity < 2:
+            raise ValueError("capacity must be at least 2")
+        self.header = None
+        self.tail = None
+        self.size = 0
+        self.capacity = capacity
+
+    def __len__(self):
+        return self.size
+
+    def __iter__(self):
+        """
+        Yields the elements in order, one node at a time.
+        """
+        current = self.header
+        while current is not None:
+            yield from current.items
+            current = current.next
+
+    def _linkAfter(self, n, new):
+        """
+        Links a new node in right after n, or as the only node if n is None.
+        """
+        if n is None:
+            self.header = self.tail = new
+            return
+        new.prev = n
+        new.next = n.next
+        if n.next is None:
+            self.tail = new
+        else:
+            n.next.prev = new
+        n.next = new
+
+    def _unlink(self, n):
+        """
+        Unlinks the given node from the linked list.
+        """
+        if n.prev is None:
+            self.header = n.next
+        else:
+            n.prev.next = n.next
+        if n.next is None:
+            self.tail = n.prev
+        else:
+            n.next.prev = n.prev
+
+    def _locate(self, pos):
+        """
+        Finds the node holding the element at the specified valid position,
+        walking from whichever end is closer.
+
+        Returns:
+            A tuple of the node and the offset of the element inside it.
+        """
+        if pos < self.size // 2:
+            current = self.header
+            while pos >= len(current.items):
+                pos -= len(current.items)
+                current = current.next
+            return current, pos
+        pos = self.size - pos
+        current = self.tail
+        while pos > len(current.items):
+            pos -= len(current.items)
+            current = current.prev
+        return current, len(current.items) - pos
+
+    def _rebalance(self, n):
+        """
+        Restores the fill of a node after a removal: empty nodes are unlinked
+        and a node under half full absorbs its successor if both fit.
+        """
+        if not n.items:
+            self._unlink(n)
+        elif len(n.items) < self.capacity // 2 and n.next is not None:
+            following = n.next
+            if len(n.items) + len(following.items) <= self.capacity:
+                n.items.extend(following.items)
+                self._unlink(following)
+
+    def prepend(self, data):
+        """
+        Inserts the given data at the beginning of the linked list.
+
+        Args:
+            data: The data to be inserted.
+        """
+        if self.header is not None and len(self.header.items) < self.capacity:
+            self.header.items.insert(0, data)
+        else:
+            n = UnrolledNode([data])
+            if self.header is None:
+                self.header = self.tail = n
+            else:
+                n.next = self.header
+                self.header.prev = n
+                self.header = n
+        self.size += 1
+
+    def append(self, data):
+        """
+        Inserts the given data at the end of the linked list.
+
+        Args:
+            data: The data to be inserted.
+        """
+        if self.tail is not None and len(self.tail.items) < self.capacity:
+            self.tail.items.append(data)
+        else:
+            self._linkAfter(self.tail, UnrolledNode([data]))
+        self.size += 1
+
+    def printList(self):
+        """
+        Returns a string representation of the linked list.
+
+        Returns:
+            A string containing each element of the linked list, separated by commas.
+        """
+        return "".join(str(data) + "," for data in self)
+
+    def get(self, pos):
+        """
+        Returns the element at the specified position.
+
+        Args:
+            pos: The position of the element.
+
+        Returns:
+            The element at that position, or None if the position is invalid.
+        """
+        if pos < 0 or pos >= self.size:
+            return None
+        n, offset = self._locate(pos)
+        return n.items[offset]
+
+    def __getitem__(self, pos):
+        """
+        Returns the element at the specified position; negative positions
+        count from the end.
+
+        Raises:
+            IndexError: If the position is out of range.
+        """
+        if pos < 0:
+            pos += self.size
+        if pos < 0 or pos >= self.size:
+            raise IndexError("list index out of range")
+        n, offset = self._locate(pos)
+        return n.items[offset]
+
+    def removeFirst(self):
+        """
+        Removes and returns the first element of the linked list.
+
+        Returns:
+            The first element, or None if the list is empty.
+        """
+        if self.size == 0:
+            return None
+        n = self.header
+        data = n.items.pop(0)
+        self.size -= 1
+        if not n.items:
+            self._unlink(n)
+        return data
+
+    def removeLast(self):
+        """
+        Removes and returns the last element of the linked list in O(1).
+
+        Returns:
+            The last element, or None if the list is empty.
+        """
+        if self.size == 0:
+            return None
+        n = self.tail
+        data = n.items.pop()
+        self.size -= 1
+        if not n.items:
+            self._unlink(n)
+        return data
+
+    def insertAt(self, pos, data):
+        """
+        Inserts the given data at the specified position in the linked list,
+        splitting the target node in half if it is full.
+
+        Args:
+            pos: The position at which to insert the data.
+            data: The data to be inserted.
+
+        Returns:
+            None if the position is invalid, otherwise returns the inserted data.
+        """
+        if pos < 0 or pos > self.size:
+            return None
+        if pos == self.size:
+            self.append(data)
+            return data
+        n, offset = self._locate(pos)
+        if len(n.items) == self.capacity:
+            half = self.capacity // 2
+            self._linkAfter(n, UnrolledNode(n.items[half:]))
+            del n.items[half:]
+            if offset > half:
+                n = n.next
+                offset -= half
+        n.items.insert(offset, data)
+        self.size += 1
+        return data
+
+    def removeAt(self, pos):
+        """
+        Removes and returns the element at the specified position in the linked
+        list, merging the node with its successor if it becomes sparse.
+
+        Args:
+            pos: The position of the element to remove.
+
+        Returns:
+            The removed element, or None if the position is invalid.
+        """
+        if pos < 0 or pos >= self.size:
+            return None
+        n, offset = self._locate(pos)
+        data = n.items.pop(offset)
+        self.size -= 1
+        self._rebalance(n)
+        return data
+
+
+# Example Usage
+if __name__ == "__main__":
+    unrolled = UnrolledLinkedList(capacity=4)
+    for i in range(10):
+        unrolled.append(i)
+    unrolled.prepend(-1)
+    unrolled.insertAt(3, 99)
+    unrolled.removeAt(8)
+    unrolled.removeLast()
+    print(unrolled.printList(), unrolled.size, unrolled[3])